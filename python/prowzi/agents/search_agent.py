@@ -29,6 +29,7 @@ from prowzi.tools.search_tools import (
     PubMedSearch,
     SearchResult,
     SemanticScholarSearch,
+    get_session,
     multi_engine_search,
 )
 
@@ -155,6 +156,10 @@ class SearchAgent:
 
         self.engines, self.max_engine_results = self._initialize_engines()
 
+    async def prewarm(self) -> None:
+        """Open the shared HTTP session ahead of the first search."""
+        await get_session()
+
     async def execute_plan(
         self,
         plan: ResearchPlan,
@@ -33,12 +33,15 @@ async def run_workflow_command(args: argparse.Namespace) -> None:
 
     logger.info("Starting workflow for prompt: %s", args.prompt[:100])
 
-    result = await orchestrator.run_research(
-        prompt=args.prompt,
-        document_paths=[Path(p) for p in args.documents] if args.documents else None,
-        max_results_per_query=args.max_results,
-        max_sections=args.max_sections,
-    )
+    try:
+        result = await orchestrator.run_research(
+            prompt=args.prompt,
+            document_paths=[Path(p) for p in args.documents] if args.documents else None,
+            max_results_per_query=args.max_results,
+            max_sections=args.max_sections,
+        )
+    finally:
+        await orchestrator.aclose()
 
     logger.info("Workflow completed successfully")
     logger.info("Session ID: %s", result.metadata.get("session_id"))
@@ -57,7 +60,10 @@ async def resume_workflow_command(args: argparse.Namespace) -> None:
 
     logger.info("Resuming workflow from checkpoint: %s", args.checkpoint_id)
 
-    result = await orchestrator.resume_from_checkpoint(checkpoint_id=args.checkpoint_id)
+    try:
+        result = await orchestrator.resume_from_checkpoint(checkpoint_id=args.checkpoint_id)
+    finally:
+        await orchestrator.aclose()
 
     logger.info("Workflow resumed and completed successfully")
     logger.info("Session ID: %s", result.metadata.get("session_id"))
@@ -94,6 +94,7 @@ class ProwziConfig:
         self.log_level = os.getenv("PROWZI_LOG_LEVEL", "INFO")
         self.enable_telemetry = os.getenv("PROWZI_ENABLE_TELEMETRY", "true").lower() == "true"
         self.enable_checkpointing = os.getenv("PROWZI_ENABLE_CHECKPOINTING", "false").lower() == "true"
+        self.max_retry_sleep = float(os.getenv("PROWZI_MAX_RETRY_SLEEP", "30.0"))
 
         # Quality thresholds
         self.min_source_quality = float(os.getenv("PROWZI_MIN_SOURCE_QUALITY", "0.7"))
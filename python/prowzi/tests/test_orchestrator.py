@@ -0,0 +1,277 @@
+"""Tests for the workflow orchestrator's checkpoint round trip.
+
+Agents are replaced with stubs returning fixed results, so no LLM or search
+API is called.
+"""
+
+import dataclasses
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from prowzi.agents.evaluation_agent import EvaluationAgentResult
+from prowzi.agents.intent_agent import IntentAnalysis
+from prowzi.agents.planning_agent import QueryType, ResearchPlan, SearchQuery, Task, TaskPriority
+from prowzi.agents.search_agent import SearchAgentResult
+from prowzi.agents.turnitin_agent import (
+    TurnitinAgentResult,
+    TurnitinIteration,
+    TurnitinReport,
+    TurnitinSubmission,
+    TurnitinThresholds,
+)
+from prowzi.agents.verification_agent import VerificationAgentResult
+from prowzi.agents.writing_agent import WritingAgentResult
+from prowzi.config import ProwziConfig
+from prowzi.workflows.checkpoint import CheckpointManager, WorkflowCheckpoint
+from prowzi.workflows.orchestrator import ProwziOrchestrationResult, ProwziOrchestrator
+
+
+def _stub(result):
+    calls = []
+
+    async def agent_call(**kwargs):
+        calls.append(kwargs)
+        return result
+
+    agent_call.calls = calls
+    agent_call.result = result
+    return agent_call
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch) -> ProwziOrchestrator:
+    """Orchestrator checkpointing to tmp_path, with every agent stubbed."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    config = ProwziConfig()
+    config.enable_checkpointing = True
+    config.enable_telemetry = False
+    config.checkpoint_dir = tmp_path
+
+    orchestrator = ProwziOrchestrator(config=config)
+    draft = WritingAgentResult(
+        outline=[],
+        sections=[],
+        total_word_count=1200,
+        bibliography=["Doe (2024)"],
+        style_guidelines=[],
+        overall_strategy="",
+        executive_summary="",
+    )
+    report = TurnitinReport(
+        submission_id="sub-1",
+        similarity_score=0.05,
+        ai_detection_score=0.02,
+        fetched_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        similarity_report={},
+        ai_detection_report={},
+    )
+    orchestrator.intent_agent.analyze = _stub(
+        IntentAnalysis(
+            document_type="research_paper",
+            field="Computer Science",
+            academic_level="undergraduate",
+            word_count=1200,
+            explicit_requirements=["Survey quantum algorithms"],
+            implicit_requirements=[],
+            missing_info=[],
+            confidence_score=0.9,
+            requires_user_input=False,
+            parsed_documents=[],
+            metadata={},
+        )
+    )
+    orchestrator.planning_agent.create_plan = _stub(
+        ResearchPlan(
+            task_hierarchy=Task(id="task_001", name="Overview", description="", priority=TaskPriority.HIGH),
+            execution_order=["task_001"],
+            parallel_groups=[["task_001"]],
+            search_queries=[
+                SearchQuery(
+                    query="quantum algorithms",
+                    query_type=QueryType.BROAD,
+                    priority=TaskPriority.HIGH,
+                    category="computer_science",
+                )
+            ],
+            quality_checkpoints=[],
+            resource_estimates={},
+            contingencies=[],
+        )
+    )
+    orchestrator.search_agent.execute_plan = _stub(
+        SearchAgentResult(
+            query_summaries=[],
+            total_results=3,
+            high_quality_results=2,
+            average_relevance=0.7,
+            coverage_gaps=[],
+            metadata={"engines_used": ["arxiv"]},
+        )
+    )
+    orchestrator.verification_agent.verify_sources = _stub(
+        VerificationAgentResult(
+            verified_sources=[],
+            average_score=80.0,
+            accepted_sources=["https://arxiv.org/abs/2301.12345"],
+            rejected_sources=[],
+            high_risk_sources=[],
+            analyst_summary="",
+            risk_flags=[],
+            recommended_next_steps=[],
+        )
+    )
+    orchestrator.writing_agent.generate_document = _stub(draft)
+    orchestrator.evaluation_agent.evaluate_draft = _stub(
+        EvaluationAgentResult(
+            total_score=82.0,
+            pass_threshold=70.0,
+            overall_assessment="",
+            reviewer_summary="",
+            risks=[],
+            next_iteration_plan=[],
+            criteria=[],
+            section_feedback=[],
+        )
+    )
+    orchestrator.turnitin_agent.ensure_compliance = _stub(
+        TurnitinAgentResult(
+            success=True,
+            final_document=draft,
+            final_report=report,
+            iterations=[
+                TurnitinIteration(
+                    attempt=1,
+                    submission=TurnitinSubmission(
+                        submission_id="sub-1",
+                        attempt=1,
+                        submitted_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                    ),
+                    report=report,
+                    redraft_applied=False,
+                )
+            ],
+            thresholds=TurnitinThresholds(similarity=0.15, ai_detection=0.2),
+        )
+    )
+    return orchestrator
+
+
+def _save_search_checkpoint(orchestrator: ProwziOrchestrator) -> str:
+    """Checkpoint a session that has completed the search stage."""
+    return orchestrator.checkpoint_manager.save_checkpoint(
+        session_id="session-1",
+        stage="search",
+        prompt="Survey quantum algorithms",
+        context={
+            "intent": orchestrator.intent_agent.analyze.result,
+            "plan": orchestrator.planning_agent.create_plan.result,
+            "search": orchestrator.search_agent.execute_plan.result,
+            "stage_metrics": {"search": {"status": "completed"}},
+        },
+        stage_metrics={"search": {"status": "completed"}},
+    )
+
+
+class TestResumeFromCheckpoint:
+    """Checkpoints can be loaded back and resumed."""
+
+    def test_load_checkpoint_restores_metadata_and_results(self, orchestrator: ProwziOrchestrator):
+        checkpoint_id = _save_search_checkpoint(orchestrator)
+
+        checkpoint = orchestrator.checkpoint_manager.load_checkpoint(checkpoint_id)
+
+        assert isinstance(checkpoint, WorkflowCheckpoint)
+        assert checkpoint.metadata.stage == "search"
+        assert checkpoint.metadata.prompt == "Survey quantum algorithms"
+        assert checkpoint.intent == orchestrator.intent_agent.analyze.result
+        assert checkpoint.plan == orchestrator.planning_agent.create_plan.result
+        assert checkpoint.plan.search_queries[0].query_type is QueryType.BROAD
+        assert checkpoint.search == orchestrator.search_agent.execute_plan.result
+        assert checkpoint.verification is None
+        assert checkpoint.stage_metrics == {"search": {"status": "completed"}}
+
+    async def test_resume_batch_round_trip(self, orchestrator: ProwziOrchestrator):
+        saved_id = _save_search_checkpoint(orchestrator)
+        await orchestrator.run_research("Survey quantum algorithms")
+        (run_checkpoint,) = [
+            c for c in orchestrator.checkpoint_manager.list_checkpoints() if c.checkpoint_id != saved_id
+        ]
+
+        outcomes = await orchestrator.resume_batch([saved_id, run_checkpoint.checkpoint_id])
+
+        assert list(outcomes) == [saved_id, run_checkpoint.checkpoint_id]
+        for outcome in outcomes.values():
+            assert isinstance(outcome, ProwziOrchestrationResult)
+            assert outcome.turnitin.success
+        # Neither resume repeats the stages its checkpoint had completed
+        assert len(orchestrator.search_agent.execute_plan.calls) == 1
+        assert len(orchestrator.verification_agent.verify_sources.calls) == 2
+
+
+    async def test_resume_loads_checkpoint_once(self, orchestrator: ProwziOrchestrator, monkeypatch):
+        saved_id = _save_search_checkpoint(orchestrator)
+        manager = orchestrator.checkpoint_manager
+        loaded = []
+
+        def load_checkpoint(checkpoint_id):
+            loaded.append(checkpoint_id)
+            return type(manager).load_checkpoint(manager, checkpoint_id)
+
+        monkeypatch.setattr(manager, "load_checkpoint", load_checkpoint)
+
+        result = await orchestrator.resume_from_checkpoint(saved_id)
+
+        assert loaded == [saved_id]
+        assert result.metadata["session_id"] == saved_id
+        assert len(orchestrator.search_agent.execute_plan.calls) == 0
+
+
+class TestCheckpointIndex:
+    """Managers sharing a checkpoint directory see each other's checkpoints."""
+
+    def test_managers_created_earlier_load_and_keep_later_checkpoints(self, orchestrator: ProwziOrchestrator, tmp_path):
+        other = CheckpointManager(tmp_path)
+        saved_id = _save_search_checkpoint(orchestrator)
+
+        assert other.load_checkpoint(saved_id) is not None
+        other_id = other.save_checkpoint(
+            session_id="session-2",
+            stage="intent",
+            prompt="Another prompt",
+            context={},
+            stage_metrics={},
+        )
+
+        fresh = CheckpointManager(tmp_path)
+        assert {c.checkpoint_id for c in fresh.list_checkpoints()} == {saved_id, other_id}
+        assert fresh.load_checkpoint(saved_id).search == orchestrator.search_agent.execute_plan.result
+
+
+class TestResultMetadata:
+    """The result metadata stays plain data."""
+
+    async def test_metadata_is_json_serializable(self, orchestrator: ProwziOrchestrator):
+        result = await orchestrator.run_research("Survey quantum algorithms")
+
+        encoded = json.loads(json.dumps(result.metadata))
+
+        assert encoded["stage_metrics"]["search"]["attempts"] == 1
+        assert encoded["stage_metrics"]["search"]["success"] is True
+
+
+class TestPostTurnitinEvaluation:
+    """Redrafts are only re-evaluated when they changed the document."""
+
+    async def test_unchanged_redraft_reuses_initial_evaluation(self, orchestrator: ProwziOrchestrator):
+        turnitin = orchestrator.turnitin_agent.ensure_compliance.result
+        turnitin.iterations[0].redraft_applied = True
+        # An equal but distinct document, as a no-op redraft would return
+        turnitin.final_document = dataclasses.replace(turnitin.final_document)
+
+        result = await orchestrator.run_research("Survey quantum algorithms")
+
+        assert len(orchestrator.evaluation_agent.evaluate_draft.calls) == 1
+        assert result.evaluation is orchestrator.evaluation_agent.evaluate_draft.result
+        assert "fingerprint" not in result.metadata["stage_details"]["evaluation"]
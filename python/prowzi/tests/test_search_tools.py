@@ -9,6 +9,9 @@ Tests search engine integrations including:
 - Relevance scoring
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, patch, Mock
 from prowzi.tools.search_tools import (
@@ -20,6 +23,10 @@ from prowzi.tools.search_tools import (
     PerplexitySearch,
     multi_engine_search,
     deduplicate_results,
+    score_bm25,
+    get_session,
+    close_session,
+    _get_cache_client,
 )
 
 
@@ -102,6 +109,31 @@ class TestSemanticScholarSearch:
                 # Should return empty list on error
                 assert results == []
 
+    @pytest.mark.asyncio
+    async def test_transient_error_retried(self, mock_semantic_scholar_response: dict):
+        """Test that a 503 is retried before results are parsed."""
+        unavailable = AsyncMock()
+        unavailable.status = 503
+
+        ok = AsyncMock()
+        ok.status = 200
+        ok.json = AsyncMock(return_value=mock_semantic_scholar_response)
+
+        def respond(response):
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(return_value=response)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            return mock_context
+
+        mock_session = AsyncMock()
+        mock_session.get = Mock(side_effect=[respond(unavailable), respond(ok)])
+
+        engine = SemanticScholarSearch(session=mock_session, retry_backoff=0)
+        results = await engine.search("retry query")
+
+        assert mock_session.get.call_count == 2
+        assert len(results) > 0
+
     @pytest.mark.asyncio
     async def test_citation_count_extraction(self, mock_semantic_scholar_response: dict):
         """Test that citation counts are properly extracted."""
@@ -245,6 +277,118 @@ class TestPubMedSearch:
             assert all(r.source_type == SourceType.ACADEMIC_PAPER for r in results)
 
 
+class TestSharedSession:
+    """Test the shared aiohttp session used by all engines."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_within_loop(self):
+        """Test that repeated lookups return the same pooled session."""
+        session = await get_session()
+        try:
+            assert await get_session() is session
+        finally:
+            await close_session()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_per_loop(self):
+        """Test that another loop's session is neither shared nor closed."""
+        other_loop = asyncio.new_event_loop()
+        other_thread = threading.Thread(target=other_loop.run_forever)
+        other_thread.start()
+        try:
+            other = asyncio.run_coroutine_threadsafe(get_session(), other_loop).result()
+            session = await get_session()
+            try:
+                assert session is not other
+                assert not other.closed
+            finally:
+                await close_session()
+            assert not other.closed
+            asyncio.run_coroutine_threadsafe(close_session(), other_loop).result()
+            assert other.closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            other_thread.join()
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_explicit_session_takes_precedence(self, mock_semantic_scholar_response: dict):
+        """Test that an engine uses the session it was constructed with."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=mock_semantic_scholar_response)
+
+        mock_context = AsyncMock()
+        mock_context.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_context.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = Mock()
+        mock_session.get = Mock(return_value=mock_context)
+
+        engine = SemanticScholarSearch(api_key="test-key", session=mock_session)
+        results = await engine.search("quantum computing")
+
+        mock_session.get.assert_called_once()
+        assert len(results) > 0
+
+
+class TestSearchCache:
+    """Test the optional Redis-backed search cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_http(self, mock_semantic_scholar_response: dict):
+        """Test that a cached response is served without another request."""
+        store: dict = {}
+
+        fake_cache = Mock()
+        fake_cache.get = AsyncMock(side_effect=lambda key: store.get(key))
+
+        async def setex(key, ttl, value):
+            store[key] = value
+
+        fake_cache.setex = AsyncMock(side_effect=setex)
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=mock_semantic_scholar_response)
+
+        mock_context = AsyncMock()
+        mock_context.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_context.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = Mock()
+        mock_session.get = Mock(return_value=mock_context)
+
+        engine = SemanticScholarSearch(api_key="test-key", session=mock_session)
+
+        with patch("prowzi.tools.search_tools._get_cache_client", return_value=fake_cache):
+            first = await engine.search("quantum computing", max_results=5)
+            second = await engine.search("quantum computing", max_results=5)
+
+        assert mock_session.get.call_count == 1
+        assert [r.to_dict() for r in second] == [r.to_dict() for r in first]
+        assert all(r.source_type == SourceType.ACADEMIC_PAPER for r in second)
+
+
+    def test_client_of_closed_loop_is_closed(self, monkeypatch):
+        """Test that a new loop's client replaces and closes a closed loop's client."""
+        clients = [AsyncMock(), AsyncMock()]
+        fake_redis = Mock()
+        fake_redis.Redis.from_url = Mock(side_effect=clients)
+        monkeypatch.setattr("prowzi.tools.search_tools.redis_asyncio", fake_redis)
+        monkeypatch.setattr("prowzi.tools.search_tools._CACHE_CLIENTS", {})
+        monkeypatch.setenv("PROWZI_SEARCH_CACHE_URL", "redis://localhost:6379/0")
+
+        first = asyncio.run(_get_cache_client())
+        second = asyncio.run(_get_cache_client())
+
+        assert (first, second) == (clients[0], clients[1])
+        clients[0].aclose.assert_awaited_once()
+        clients[1].aclose.assert_not_awaited()
+
+
 class TestMultiEngineSearch:
     """Test multi-engine search coordination."""
 
@@ -291,6 +435,156 @@ class TestMultiEngineSearch:
         # Should remove duplicates based on URL
         assert len(deduplicated) == 1
 
+    @pytest.mark.asyncio
+    async def test_semaphore_caps_in_flight_searches(self):
+        """Test that a shared semaphore bounds concurrent engine searches."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_search(query, max_results):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        engines = []
+        for _ in range(5):
+            engine = AsyncMock()
+            engine.search = slow_search
+            engines.append(engine)
+
+        await multi_engine_search("query", engines=engines, semaphore=asyncio.Semaphore(2))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_min_results_cancels_slow_engines(self):
+        """Test that reaching min_results stops waiting on slower engines."""
+        cancelled = asyncio.Event()
+
+        async def fast_search(query, max_results):
+            return [
+                SearchResult(
+                    title=f"Fast Result {i}",
+                    url=f"https://fast.com/{i}",
+                    content="Content",
+                    source_type=SourceType.WEB_ARTICLE,
+                )
+                for i in range(3)
+            ]
+
+        async def slow_search(query, max_results):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return []
+
+        fast_engine = AsyncMock()
+        fast_engine.search = fast_search
+        slow_engine = AsyncMock()
+        slow_engine.search = slow_search
+
+        results = await asyncio.wait_for(
+            multi_engine_search("query", engines=[slow_engine, fast_engine], min_results=3),
+            timeout=1,
+        )
+        await asyncio.sleep(0)
+
+        assert len(results) == 3
+        assert cancelled.is_set()
+
+    def test_near_duplicate_titles_removed(self):
+        """Test that near-identical titles from different URLs are collapsed."""
+        results = [
+            SearchResult(
+                title="Attention Is All You Need",
+                url="https://arxiv.org/abs/1706.03762",
+                content="Content",
+                source_type=SourceType.PREPRINT,
+            ),
+            SearchResult(
+                title="Attention Is All You Needs",
+                url="https://papers.nips.cc/paper/7181",
+                content="Content",
+                source_type=SourceType.ACADEMIC_PAPER,
+            ),
+            SearchResult(
+                title="Quantum Algorithms Deep Dive",
+                url="https://example.com/algorithms",
+                content="Content",
+                source_type=SourceType.WEB_ARTICLE,
+            ),
+        ]
+
+        deduplicated = deduplicate_results(results)
+
+        assert [r.url for r in deduplicated] == [
+            "https://arxiv.org/abs/1706.03762",
+            "https://example.com/algorithms",
+        ]
+        assert len(deduplicate_results(results, near_duplicate_threshold=None)) == 3
+
+    def test_titles_and_urls_normalized_for_exact_matches(self):
+        """Test that punctuation, utm_* params and trailing slashes are ignored."""
+        results = [
+            SearchResult(
+                title="Attention Is All You Need",
+                url="https://example.com/paper/",
+                content="Content",
+                source_type=SourceType.PREPRINT,
+            ),
+            SearchResult(
+                title="Different Title",
+                url="https://example.com/paper?utm_source=feed",
+                content="Content",
+                source_type=SourceType.WEB_ARTICLE,
+            ),
+            SearchResult(
+                title="Attention is all you need.",
+                url="https://papers.nips.cc/paper/7181",
+                content="Content",
+                source_type=SourceType.ACADEMIC_PAPER,
+            ),
+        ]
+
+        deduplicated = deduplicate_results(results, near_duplicate_threshold=None)
+
+        assert [r.url for r in deduplicated] == ["https://example.com/paper/"]
+
+    def test_utm_params_before_fragment_ignored(self):
+        """Test that utm_* params followed by an anchor are stripped too."""
+        results = [
+            SearchResult(
+                title="Attention Is All You Need",
+                url="https://example.com/paper#abstract",
+                content="Content",
+                source_type=SourceType.PREPRINT,
+            ),
+            SearchResult(
+                title="Different Title",
+                url="https://example.com/paper?utm_source=feed#abstract",
+                content="Content",
+                source_type=SourceType.WEB_ARTICLE,
+            ),
+            SearchResult(
+                title="Another Title",
+                url="https://example.com/paper?id=7&utm_medium=email#abstract",
+                content="Content",
+                source_type=SourceType.WEB_ARTICLE,
+            ),
+        ]
+
+        deduplicated = deduplicate_results(results, near_duplicate_threshold=None)
+
+        assert [r.url for r in deduplicated] == [
+            "https://example.com/paper#abstract",
+            "https://example.com/paper?id=7&utm_medium=email#abstract",
+        ]
+
     @pytest.mark.asyncio
     async def test_error_handling_in_multi_search(self):
         """Test that multi-engine search handles engine failures gracefully."""
@@ -355,6 +649,47 @@ class TestRelevanceScoring:
         for i in range(len(ranked) - 1):
             assert ranked[i].relevance_score >= ranked[i + 1].relevance_score
 
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_bm25_ranks_matching_results_first(self, use_numpy: bool):
+        """Test BM25 scoring with and without numpy."""
+        results = [
+            SearchResult(
+                title="Cooking with cast iron",
+                url="https://example.com/cooking",
+                content="Seasoning pans and skillets",
+                source_type=SourceType.BLOG,
+            ),
+            SearchResult(
+                title="Quantum error correction",
+                url="https://example.com/qec",
+                content="Surface codes protect quantum computing hardware",
+                source_type=SourceType.ACADEMIC_PAPER,
+            ),
+            SearchResult(
+                title="Introduction to computing",
+                url="https://example.com/intro",
+                content="A history of computing machines",
+                source_type=SourceType.BOOK,
+            ),
+        ]
+
+        if use_numpy:
+            pytest.importorskip("numpy")
+            ranked = score_bm25("quantum computing", results)
+        else:
+            with patch("prowzi.tools.search_tools.np", None):
+                ranked = score_bm25("quantum computing", results)
+
+        assert [r.url for r in ranked] == [
+            "https://example.com/qec",
+            "https://example.com/intro",
+            "https://example.com/cooking",
+        ]
+        assert ranked[0].metadata["bm25_score"] == pytest.approx(1.0)
+        assert ranked[-1].metadata["bm25_score"] == 0.0
+        # Left for the search agent's own scoring
+        assert all(r.relevance_score == 0.0 for r in ranked)
+
 
 class TestSearchEdgeCases:
     """Test edge cases and error scenarios."""
@@ -0,0 +1,88 @@
+"""Tests for the general-purpose agent tools in prowzi/tools.py.
+
+The module is shadowed by the prowzi.tools package, so it is loaded from its
+file path.
+"""
+
+import importlib.util
+import math
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location("prowzi_tools_module", Path(__file__).resolve().parents[1] / "tools.py")
+tools = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tools)
+
+
+class TestValidatePythonSyntax:
+    """Test Python syntax validation."""
+
+    def test_valid_code(self):
+        """Test that well-formed code is accepted."""
+        assert tools.validate_python_syntax("def f(x):\n    return x + 1\n")["valid"] is True
+
+    @pytest.mark.parametrize(
+        "code",
+        ["return 1", "break", "def f():\n  nonlocal x"],
+    )
+    def test_compile_time_errors(self, code: str):
+        """Test that errors only the compiler raises are reported."""
+        result = tools.validate_python_syntax(code)
+
+        assert result["valid"] is False
+        assert result["line"] is not None
+
+    def test_parse_error(self):
+        """Test that parse errors report their line."""
+        result = tools.validate_python_syntax("x = 1\ndef f(:\n")
+
+        assert result["valid"] is False
+        assert result["line"] == 2
+
+
+class TestListFiles:
+    """Test directory listing."""
+
+    @pytest.mark.parametrize("pattern", ["*.md", "*", "**/*.md"])
+    def test_paths_match_glob(self, tmp_path, monkeypatch, pattern: str):
+        """Test that listed paths keep the form Path.glob produces."""
+        (tmp_path / "README.md").write_text("readme")
+        (tmp_path / "notes.txt").write_text("notes")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").write_text("guide")
+        monkeypatch.chdir(tmp_path)
+
+        for directory in (".", str(tmp_path), "docs/.."):
+            expected = sorted(str(f) for f in Path(directory).glob(pattern) if f.is_file())
+            assert sorted(tools.list_files(directory, pattern)) == expected
+
+
+class TestJson:
+    """Test JSON creation and parsing."""
+
+    def test_round_trip(self):
+        """Test that created JSON parses back to the same data."""
+        data = {"title": "Résumé", "count": 3, "tags": ["a", "b"], "nested": {"ok": True}}
+
+        for pretty in (True, False):
+            assert tools.parse_json(tools.create_json(data, pretty=pretty)) == data
+
+    @pytest.mark.skipif(tools.orjson is None, reason="orjson not installed")
+    def test_orjson_output_format(self):
+        """Test the format orjson produces: compact separators, NaN as null."""
+        assert tools.create_json({"a": 1, "b": [1, 2]}, pretty=False) == '{"a":1,"b":[1,2]}'
+        assert tools.create_json({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+        assert tools.create_json({"x": float("nan"), "y": float("inf")}, pretty=False) == '{"x":null,"y":null}'
+
+    def test_values_orjson_rejects_fall_back_to_json(self):
+        """Test that big integers and tuple keys are still encoded."""
+        assert tools.parse_json(tools.create_json({"big": 2**70}, pretty=False)) == {"big": 2**70}
+        assert tools.create_json({(1, 2): "pair"}).startswith("Error creating JSON")
+        assert math.isnan(tools.parse_json("NaN"))
+
+    def test_parse_error_reports_position(self):
+        """Test that invalid JSON reports line and column."""
+        message = tools.parse_json('{"a": 1,\n}')
+
+        assert message.startswith("JSON parse error at line 2, column 1:")
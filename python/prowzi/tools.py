@@ -16,13 +16,63 @@ All tools are designed to be:
 - Autonomous-friendly (agents decide when to use them)
 """
 
+import ast
+import fnmatch
 import json
 import os
 import re
+import stat
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional speedup
+    hyperscan = None
+
+
+def _json_loads(data: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Retry with json, which also accepts NaN/Infinity and reports the
+            # error position of input that is really invalid
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, pretty: bool) -> str:
+    """Encode with orjson where possible.
+
+    Differs from json.dumps in two ways: compact output has no spaces after
+    separators, and NaN/Infinity are written as null.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            # orjson cannot encode integers wider than 64 bits or keys such as tuples
+            pass
+    return json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+
+
+_WORD_RE = re.compile(r"\S+")
+
+# Files above this size are read in one buffered binary call
+_LARGE_FILE_BYTES = 1 << 20
+
+
 # ============================================================================
 # Information Retrieval Tools
 # ============================================================================
@@ -135,7 +185,6 @@ def calculate(
                 percent_part = parts[0].replace("%", "").strip()
                 value_part = parts[1].strip()
                 # SECURITY: Use ast.literal_eval instead of eval for safe evaluation
-                import ast
                 percent = float(ast.literal_eval(percent_part))
                 value = float(ast.literal_eval(value_part))
                 result = (percent / 100) * value
@@ -143,7 +192,6 @@ def calculate(
 
         # SECURITY: Use ast.literal_eval for safe evaluation of literals only
         # This prevents code injection while allowing numbers, strings, lists, etc.
-        import ast
         result = ast.literal_eval(expression)
         return str(result)
     except Exception as e:
@@ -184,6 +232,78 @@ def find_pattern(
         return {"error": str(e), "matches": [], "count": 0}
 
 
+@lru_cache(maxsize=64)
+def _compile_pattern_database(patterns: tuple[str, ...]) -> Any:
+    """Compile patterns into one Hyperscan database, or None if unsupported."""
+    if hyperscan is None:
+        return None
+    # UCP keeps \w/\s/\d Unicode-aware like Python's re
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except Exception:
+        # Backreferences, lookarounds etc. are not supported by Hyperscan
+        return None
+    return db
+
+
+def _patterns_present(text: str, patterns: tuple[str, ...]) -> set[int] | None:
+    """Return indices of patterns that match somewhere in text using a single scan."""
+    db = _compile_pattern_database(patterns)
+    if db is None:
+        return None
+
+    present: set[int] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        present.add(pattern_id)
+
+    try:
+        db.scan(text.encode("utf-8"), match_event_handler=on_match)
+    except Exception:
+        return None
+    return present
+
+
+def find_patterns(
+    text: Annotated[str, "Text to search in"],
+    patterns: Annotated[list[str], "Patterns to search for (supports regex)"],
+) -> dict[str, dict[str, Any]]:
+    """Find several patterns in text at once.
+
+    When Hyperscan is installed, all patterns are scanned in a single pass and
+    only the patterns that occur are re-run through ``re`` to collect matches.
+
+    Args:
+        text: Text to search in
+        patterns: Patterns to find (regex supported)
+
+    Returns:
+        Dictionary mapping each pattern to its ``find_pattern`` result
+    """
+    unique_patterns = tuple(dict.fromkeys(patterns))
+    present = _patterns_present(text, unique_patterns)
+
+    results: dict[str, dict[str, Any]] = {}
+    for idx, pattern in enumerate(unique_patterns):
+        if present is not None and idx not in present:
+            results[pattern] = {"matches": [], "count": 0, "pattern": pattern}
+        else:
+            results[pattern] = find_pattern(text, pattern)
+    return results
+
+
 def analyze_text(
     text: Annotated[str, "Text to analyze"],
 ) -> dict[str, Any]:
@@ -195,16 +315,19 @@ def analyze_text(
     Returns:
         Dictionary with text statistics
     """
-    words = text.split()
-    sentences = text.split(".")
-    lines = text.split("\n")
+    # Count instead of split so no intermediate word/line lists are built
+    word_count = 0
+    total_word_length = 0
+    for match in _WORD_RE.finditer(text):
+        word_count += 1
+        total_word_length += match.end() - match.start()
 
     return {
         "character_count": len(text),
-        "word_count": len(words),
-        "sentence_count": len(sentences),
-        "line_count": len(lines),
-        "average_word_length": sum(len(w) for w in words) / len(words) if words else 0,
+        "word_count": word_count,
+        "sentence_count": text.count(".") + 1,
+        "line_count": text.count("\n") + 1,
+        "average_word_length": total_word_length / word_count if word_count else 0,
     }
 
 
@@ -225,6 +348,8 @@ def validate_python_syntax(
         Dictionary with validation results
     """
     try:
+        # compile(), not ast.parse: some errors ("return" outside a function,
+        # a stray "break", "nonlocal" at module level) are only raised by the compiler
         compile(code, "<string>", "exec")
         return {"valid": True, "message": "Syntax is valid"}
     except SyntaxError as e:
@@ -305,12 +430,22 @@ def read_text_file(
     """
     try:
         path = Path(file_path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return f"Error: File not found: {file_path}"
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return f"Error: Not a file: {file_path}"
 
-        return path.read_text(encoding="utf-8")
+        if st.st_size <= _LARGE_FILE_BYTES:
+            return path.read_text(encoding="utf-8")
+
+        with open(path, "rb", buffering=_LARGE_FILE_BYTES) as f:
+            text = f.read().decode("utf-8")
+        # Match read_text's universal-newline translation
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
     except Exception as e:
         return f"Error reading file: {e!s}"
 
@@ -330,8 +465,10 @@ def write_text_file(
     """
     try:
         path = Path(file_path)
+        # Encode once and write bytes directly, skipping the TextIOWrapper layer
+        encoded = content.encode("utf-8")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(encoded)
         return f"Successfully wrote {len(content)} characters to {file_path}"
     except Exception as e:
         return f"Error writing file: {e!s}"
@@ -357,7 +494,15 @@ def list_files(
         if not path.is_dir():
             return [f"Error: Not a directory: {directory}"]
 
-        files = [str(f) for f in path.glob(pattern) if f.is_file()]
+        if "**" in pattern or "/" in pattern or os.sep in pattern:
+            files = [str(f) for f in path.glob(pattern) if f.is_file()]
+        else:
+            # Flat patterns only need the directory's own entries; scandir reuses
+            # the cached DirEntry type info instead of stat-ing every entry.
+            # Paths are joined as Path.glob does, so "." lists "README.md", not "./README.md".
+            name_matches = re.compile(fnmatch.translate(pattern)).match
+            with os.scandir(path) as entries:
+                files = [str(path / entry.name) for entry in entries if entry.is_file() and name_matches(entry.name)]
         return files if files else [f"No files matching '{pattern}' found in {directory}"]
     except Exception as e:
         return [f"Error listing files: {e!s}"]
@@ -375,7 +520,8 @@ def parse_json(
         Parsed dictionary or error message
     """
     try:
-        return json.loads(json_string)
+        return _json_loads(json_string)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
     except json.JSONDecodeError as e:
         return f"JSON parse error at line {e.lineno}, column {e.colno}: {e.msg}"
     except Exception as e:
@@ -396,9 +542,7 @@ def create_json(
         JSON string
     """
     try:
-        if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        return _json_dumps(data, pretty)
     except Exception as e:
         return f"Error creating JSON: {e!s}"
 
@@ -467,91 +611,109 @@ def create_bullet_list(
 # ============================================================================
 
 
-def get_all_prowzi_tools() -> list[Any]:
+# Tool groups are built once at import; the getters below hand out these shared
+# tuples, so callers that need to modify a group should copy it first, e.g.
+# ``tools = list(get_research_tools())``.
+_ALL_TOOLS = (
+    # Information retrieval
+    search_knowledge_base,
+    get_current_datetime,
+    get_system_info,
+    # Data analysis
+    calculate,
+    count_items,
+    find_pattern,
+    find_patterns,
+    analyze_text,
+    # Code tools
+    validate_python_syntax,
+    format_code_snippet,
+    generate_function_template,
+    # File operations
+    read_text_file,
+    write_text_file,
+    list_files,
+    parse_json,
+    create_json,
+    # Text formatting
+    format_as_table,
+    create_bullet_list,
+)
+
+_RESEARCH_TOOLS = (
+    search_knowledge_base,
+    get_current_datetime,
+    find_pattern,
+    analyze_text,
+    read_text_file,
+    list_files,
+)
+
+_ANALYST_TOOLS = (
+    calculate,
+    count_items,
+    find_pattern,
+    find_patterns,
+    analyze_text,
+    parse_json,
+    format_as_table,
+)
+
+_PLANNER_TOOLS = (
+    get_current_datetime,
+    create_bullet_list,
+    format_as_table,
+    count_items,
+)
+
+_EXECUTOR_TOOLS = (
+    validate_python_syntax,
+    format_code_snippet,
+    generate_function_template,
+    write_text_file,
+    read_text_file,
+    create_json,
+    parse_json,
+)
+
+_VALIDATOR_TOOLS = (
+    validate_python_syntax,
+    analyze_text,
+    read_text_file,
+    parse_json,
+    count_items,
+)
+
+
+def get_all_prowzi_tools() -> tuple[Any, ...]:
     """Get all available Prowzi tools.
 
     Returns:
-        List of all tool functions
+        Shared tuple of all tool functions; copy it before modifying
     """
-    return [
-        # Information retrieval
-        search_knowledge_base,
-        get_current_datetime,
-        get_system_info,
-        # Data analysis
-        calculate,
-        count_items,
-        find_pattern,
-        analyze_text,
-        # Code tools
-        validate_python_syntax,
-        format_code_snippet,
-        generate_function_template,
-        # File operations
-        read_text_file,
-        write_text_file,
-        list_files,
-        parse_json,
-        create_json,
-        # Text formatting
-        format_as_table,
-        create_bullet_list,
-    ]
-
-
-def get_research_tools() -> list[Any]:
+    return _ALL_TOOLS
+
+
+def get_research_tools() -> tuple[Any, ...]:
     """Get tools suitable for research tasks."""
-    return [
-        search_knowledge_base,
-        get_current_datetime,
-        find_pattern,
-        analyze_text,
-        read_text_file,
-        list_files,
-    ]
+    return _RESEARCH_TOOLS
 
 
-def get_analyst_tools() -> list[Any]:
+def get_analyst_tools() -> tuple[Any, ...]:
     """Get tools suitable for analysis tasks."""
-    return [
-        calculate,
-        count_items,
-        find_pattern,
-        analyze_text,
-        parse_json,
-        format_as_table,
-    ]
+    return _ANALYST_TOOLS
 
 
-def get_planner_tools() -> list[Any]:
+def get_planner_tools() -> tuple[Any, ...]:
     """Get tools suitable for planning tasks."""
-    return [
-        get_current_datetime,
-        create_bullet_list,
-        format_as_table,
-        count_items,
-    ]
+    return _PLANNER_TOOLS
 
 
-def get_executor_tools() -> list[Any]:
+def get_executor_tools() -> tuple[Any, ...]:
     """Get tools suitable for execution tasks."""
-    return [
-        validate_python_syntax,
-        format_code_snippet,
-        generate_function_template,
-        write_text_file,
-        read_text_file,
-        create_json,
-        parse_json,
-    ]
-
-
-def get_validator_tools() -> list[Any]:
+    return _EXECUTOR_TOOLS
+
+
+def get_validator_tools() -> tuple[Any, ...]:
     """Get tools suitable for validation tasks."""
-    return [
-        validate_python_syntax,
-        analyze_text,
-        read_text_file,
-        parse_json,
-        count_items,
-    ]
+    return _VALIDATOR_TOOLS
@@ -15,8 +15,12 @@ from prowzi.tools.search_tools import (
     SemanticScholarSearch,
     SourceType,
     batch_search_queries,
+    batch_search_queries_async,
+    close_session,
     deduplicate_results,
+    get_session,
     multi_engine_search,
+    score_bm25,
 )
 
 __all__ = [
@@ -35,5 +39,9 @@ __all__ = [
     "PerplexitySearch",
     "multi_engine_search",
     "deduplicate_results",
+    "score_bm25",
     "batch_search_queries",
+    "batch_search_queries_async",
+    "get_session",
+    "close_session",
 ]
@@ -8,6 +8,22 @@ import mimetypes
 from pathlib import Path
 from typing import Any, Dict, List
 
+# Optional parser backends, resolved once at import time
+try:
+    import PyPDF2 as _PyPDF2
+except ImportError:
+    _PyPDF2 = None
+
+try:
+    from docx import Document as _DocxDocument
+except ImportError:
+    _DocxDocument = None
+
+try:
+    import yaml as _yaml
+except ImportError:
+    _yaml = None
+
 
 def parse_document(
     file_path: str | Path,
@@ -70,78 +86,72 @@ def parse_document(
 
 def _parse_pdf(file_path: Path, extract_metadata: bool) -> tuple[str, Dict[str, Any]]:
     """Parse PDF using PyPDF2 or pdfplumber"""
-    try:
-        import PyPDF2
-
-        content_parts = []
-        metadata = {}
-
-        with open(file_path, "rb") as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-
-            # Extract metadata
-            if extract_metadata and pdf_reader.metadata:
-                metadata = {
-                    "title": pdf_reader.metadata.get("/Title", ""),
-                    "author": pdf_reader.metadata.get("/Author", ""),
-                    "subject": pdf_reader.metadata.get("/Subject", ""),
-                    "creator": pdf_reader.metadata.get("/Creator", ""),
-                    "producer": pdf_reader.metadata.get("/Producer", ""),
-                    "creation_date": pdf_reader.metadata.get("/CreationDate", ""),
-                    "num_pages": len(pdf_reader.pages),
-                }
-
-            # Extract text from all pages
-            for page_num, page in enumerate(pdf_reader.pages, start=1):
-                text = page.extract_text()
-                if text.strip():
-                    content_parts.append(f"[Page {page_num}]\n{text}")
-
-        content = "\n\n".join(content_parts)
-
-        return content, metadata
-
-    except ImportError:
+    if _PyPDF2 is None:
         raise ImportError(
             "PyPDF2 is required for PDF parsing. Install with: pip install PyPDF2"
         )
 
+    content_parts = []
+    metadata = {}
 
-def _parse_docx(file_path: Path, extract_metadata: bool) -> tuple[str, Dict[str, Any]]:
-    """Parse DOCX using python-docx"""
-    try:
-        from docx import Document
-
-        doc = Document(file_path)
-
-        # Extract text from paragraphs
-        content_parts = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                content_parts.append(para.text)
-
-        content = "\n\n".join(content_parts)
+    with open(file_path, "rb") as f:
+        pdf_reader = _PyPDF2.PdfReader(f)
 
         # Extract metadata
-        metadata = {}
-        if extract_metadata:
-            core_props = doc.core_properties
+        if extract_metadata and pdf_reader.metadata:
             metadata = {
-                "title": core_props.title or "",
-                "author": core_props.author or "",
-                "subject": core_props.subject or "",
-                "keywords": core_props.keywords or "",
-                "created": str(core_props.created) if core_props.created else "",
-                "modified": str(core_props.modified) if core_props.modified else "",
+                "title": pdf_reader.metadata.get("/Title", ""),
+                "author": pdf_reader.metadata.get("/Author", ""),
+                "subject": pdf_reader.metadata.get("/Subject", ""),
+                "creator": pdf_reader.metadata.get("/Creator", ""),
+                "producer": pdf_reader.metadata.get("/Producer", ""),
+                "creation_date": pdf_reader.metadata.get("/CreationDate", ""),
+                "num_pages": len(pdf_reader.pages),
             }
 
-        return content, metadata
+        # Extract text from all pages
+        for page_num, page in enumerate(pdf_reader.pages, start=1):
+            text = page.extract_text()
+            if text.strip():
+                content_parts.append(f"[Page {page_num}]\n{text}")
+
+    content = "\n\n".join(content_parts)
+
+    return content, metadata
 
-    except ImportError:
+
+def _parse_docx(file_path: Path, extract_metadata: bool) -> tuple[str, Dict[str, Any]]:
+    """Parse DOCX using python-docx"""
+    if _DocxDocument is None:
         raise ImportError(
             "python-docx is required for DOCX parsing. Install with: pip install python-docx"
         )
 
+    doc = _DocxDocument(file_path)
+
+    # Extract text from paragraphs
+    content_parts = []
+    for para in doc.paragraphs:
+        if para.text.strip():
+            content_parts.append(para.text)
+
+    content = "\n\n".join(content_parts)
+
+    # Extract metadata
+    metadata = {}
+    if extract_metadata:
+        core_props = doc.core_properties
+        metadata = {
+            "title": core_props.title or "",
+            "author": core_props.author or "",
+            "subject": core_props.subject or "",
+            "keywords": core_props.keywords or "",
+            "created": str(core_props.created) if core_props.created else "",
+            "modified": str(core_props.modified) if core_props.modified else "",
+        }
+
+    return content, metadata
+
 
 def _parse_markdown(file_path: Path, extract_metadata: bool) -> tuple[str, Dict[str, Any]]:
     """Parse Markdown file"""
@@ -152,13 +162,10 @@ def _parse_markdown(file_path: Path, extract_metadata: bool) -> tuple[str, Dict[
         # Extract front matter if present (YAML-style)
         if content.startswith("---"):
             parts = content.split("---", 2)
-            if len(parts) >= 3:
-                try:
-                    import yaml
-                    metadata = yaml.safe_load(parts[1])
-                    content = parts[2].strip()
-                except ImportError:
-                    pass  # Skip front matter extraction if yaml not available
+            # Skip front matter extraction if yaml not available
+            if len(parts) >= 3 and _yaml is not None:
+                metadata = _yaml.safe_load(parts[1])
+                content = parts[2].strip()
 
     return content, metadata
 
@@ -249,22 +256,28 @@ def chunk_text(
     Returns:
         List of text chunks
     """
-    if len(text) <= chunk_size:
+    text_len = len(text)
+    if text_len <= chunk_size:
         return [text]
 
-    chunks = []
+    # Bind hot-loop lookups to locals once
+    sep_len = len(separator)
+    half_chunk = chunk_size // 2
+    text_rfind = text.rfind
+    chunks: List[str] = []
+    chunks_append = chunks.append
     start = 0
 
-    while start < len(text):
+    while start < text_len:
         end = start + chunk_size
 
         # If not at end, try to find separator near end
-        if end < len(text):
-            sep_pos = text.rfind(separator, start, end)
-            if sep_pos != -1 and sep_pos > start + (chunk_size // 2):
-                end = sep_pos + len(separator)
+        if end < text_len:
+            sep_pos = text_rfind(separator, start, end)
+            if sep_pos != -1 and sep_pos > start + half_chunk:
+                end = sep_pos + sep_len
 
-        chunks.append(text[start:end])
+        chunks_append(text[start:end])
         start = end - chunk_overlap
 
     return chunks
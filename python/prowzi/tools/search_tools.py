@@ -8,15 +8,69 @@ Handles deduplication, relevance scoring, and error recovery.
 """
 
 import asyncio
+import contextlib
+import functools
 import hashlib
-from dataclasses import dataclass
+import inspect
+import io
+import json
+import math
+import operator
+import os
+import random
+import re
+import threading
+import warnings
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from prowzi.config.logging_config import get_logger
 
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # pragma: no cover - optional dependency
+    MinHash = None
+    MinHashLSH = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - required for the HTTP engines only
+    aiohttp = None
+
+# SECURITY: Use defusedxml to prevent XML injection attacks
+try:
+    from defusedxml import ElementTree as ET
+except ImportError:
+    # Fallback to standard library with warning
+    import xml.etree.ElementTree as ET
+    warnings.warn("defusedxml not installed - using standard xml (less secure)", stacklevel=2)
+
 logger = get_logger(__name__)
 
+# Used for API response bodies and cached entries; orjson when installed
+_json_loads: Callable[[Any], Any] = orjson.loads if orjson is not None else json.loads
+
 
 class SourceType(Enum):
     """Type of search result source"""
@@ -30,7 +84,7 @@ class SourceType(Enum):
     DATASET = "dataset"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Standardized search result across all APIs.
 
@@ -57,35 +111,401 @@ class SearchResult:
     venue: Optional[str] = None
     doi: Optional[str] = None
     relevance_score: float = 0.0
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            "title": self.title,
-            "url": self.url,
-            "content": self.content,
-            "source_type": self.source_type.value,
-            "author": self.author,
-            "publication_date": self.publication_date,
-            "citation_count": self.citation_count,
-            "venue": self.venue,
-            "doi": self.doi,
-            "relevance_score": self.relevance_score,
-            "metadata": self.metadata,
-        }
+        data = dict(zip(_RESULT_FIELDS, _get_result_fields(self)))
+        data["source_type"] = self.source_type.value
+        return data
+
+
+_RESULT_FIELDS = (
+    "title",
+    "url",
+    "content",
+    "source_type",
+    "author",
+    "publication_date",
+    "citation_count",
+    "venue",
+    "doi",
+    "relevance_score",
+    "metadata",
+)
+_get_result_fields = operator.attrgetter(*_RESULT_FIELDS)
+
+
+def _require_aiohttp() -> None:
+    if aiohttp is None:
+        raise ImportError(
+            "aiohttp is required for search engines. Install with: pip install aiohttp"
+        )
+
+
+# Process-wide HTTP sessions so connection pooling, keep-alive and DNS caching
+# carry across queries. A ClientSession is bound to the event loop it was
+# created on, so each loop gets its own; loops on other threads never touch it.
+_SESSIONS: Dict[asyncio.AbstractEventLoop, "aiohttp.ClientSession"] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+async def get_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session for the running event loop.
+
+    Returns:
+        Shared ``aiohttp.ClientSession`` with a pooled connector
+    """
+    _require_aiohttp()
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    if session is not None and not session.closed:
+        return session
+
+    with _SESSIONS_LOCK:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        )
+        _SESSIONS[loop] = session
+        # Sessions of loops that have since closed cannot be used by anyone
+        stale = [_SESSIONS.pop(other) for other in list(_SESSIONS) if other.is_closed()]
+    for stale_session in stale:
+        # Their transports went with the loop; this only marks them closed
+        with contextlib.suppress(RuntimeError):
+            await stale_session.close()
+    return session
+
+
+async def close_session() -> None:
+    """Close the running event loop's shared aiohttp session and search cache client.
+
+    Every caller on the loop shares them, so only the code that owns the loop
+    should call this, once nothing else on it is searching.
+    """
+    loop = asyncio.get_running_loop()
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.pop(loop, None)
+    with _CACHE_CLIENTS_LOCK:
+        cache_client = _CACHE_CLIENTS.pop(loop, None)
+    if session is not None:
+        await session.close()
+    if cache_client is not None:
+        await _close_cache_client(cache_client)
+
+
+# Optional Redis-backed response cache, enabled by setting PROWZI_SEARCH_CACHE_URL.
+# Like the HTTP sessions, clients are bound to the event loop that opened them.
+_CACHE_CLIENTS: Dict[asyncio.AbstractEventLoop, Any] = {}
+_CACHE_CLIENTS_LOCK = threading.Lock()
+
+# Entries are msgpack when available, JSON otherwise; the formats use separate
+# keys so processes with and without msgpack can share one Redis
+_CACHE_KEY_PREFIX = "prowzi:search:msgpack:" if msgpack is not None else "prowzi:search:"
+
+_SearchMethod = Callable[..., Awaitable[List[SearchResult]]]
+
+
+async def _get_cache_client() -> Optional[Any]:
+    """Return the Redis client for the running loop, or None when caching is off."""
+    if redis_asyncio is None or os.getenv("PROWZI_SEARCH_CACHE_DISABLED", "false").lower() == "true":
+        return None
+    url = os.getenv("PROWZI_SEARCH_CACHE_URL")
+    if not url:
+        return None
+
+    loop = asyncio.get_running_loop()
+    client = _CACHE_CLIENTS.get(loop)
+    if client is not None:
+        return client
+
+    with _CACHE_CLIENTS_LOCK:
+        client = _CACHE_CLIENTS[loop] = redis_asyncio.Redis.from_url(url)
+        # Clients of loops that have since closed cannot be used by anyone
+        stale = [_CACHE_CLIENTS.pop(other) for other in list(_CACHE_CLIENTS) if other.is_closed()]
+    for stale_client in stale:
+        await _close_cache_client(stale_client)
+    return client
+
+
+async def _close_cache_client(client: Any) -> None:
+    try:
+        # aclose() replaced close() in redis-py 5
+        await getattr(client, "aclose", client.close)()
+    except Exception as e:
+        logger.debug(f"Closing search cache client failed: {e}")
+
+
+def _dump_cache_entry(results: List[SearchResult]) -> bytes:
+    entries = [r.to_dict() for r in results]
+    if msgpack is not None:
+        return msgpack.packb(entries, use_bin_type=True)
+    return json.dumps(entries).encode("utf-8")
+
+
+def _load_cache_entry(data: bytes) -> List[SearchResult]:
+    entries = msgpack.unpackb(data, raw=False) if msgpack is not None else _json_loads(data)
+    return [_result_from_dict(d) for d in entries]
+
+
+def _result_from_dict(data: Dict[str, Any]) -> SearchResult:
+    data = dict(data)
+    data["source_type"] = SourceType(data["source_type"])
+    return SearchResult(**data)
+
+
+def cached_search(ttl: int) -> Callable[[_SearchMethod], _SearchMethod]:
+    """Cache a ``SearchEngine.search`` implementation in Redis.
+
+    The cache key covers the engine class, query and every bound search
+    argument. Empty results are not cached so failed requests are retried.
+
+    Args:
+        ttl: Time-to-live for cached responses, in seconds
+
+    Returns:
+        Decorator for an async ``search`` method
+    """
+    def decorator(search: _SearchMethod) -> _SearchMethod:
+        signature = inspect.signature(search)
+
+        @functools.wraps(search)
+        async def wrapper(self: "SearchEngine", *args: Any, **kwargs: Any) -> List[SearchResult]:
+            client = await _get_cache_client()
+            if client is None:
+                return await search(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+            raw_key = f"{type(self).__name__}:{sorted(arguments.items(), key=lambda kv: kv[0])!r}"
+            key = _CACHE_KEY_PREFIX + hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+            try:
+                cached = await client.get(key)
+                if cached is not None:
+                    return _load_cache_entry(cached)
+            except Exception as e:
+                logger.warning(f"Search cache read failed: {e}")
+
+            results = await search(self, *args, **kwargs)
+            if results:
+                try:
+                    await client.setex(key, ttl, _dump_cache_entry(results))
+                except Exception as e:
+                    logger.warning(f"Search cache write failed: {e}")
+            return results
+
+        return wrapper
+
+    return decorator
+
+
+def _iter_xml_elements(xml_data: str, tag: str) -> Iterator[Any]:
+    """Yield each completed ``tag`` element from ``xml_data`` as it is parsed.
+
+    Yielded elements are cleared and detached from their parent once the
+    caller resumes iteration, so only one record is held in memory at a time.
+    """
+    parents: List[Any] = []
+    for event, elem in ET.iterparse(io.StringIO(xml_data), events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag != tag:
+            continue
+        yield elem
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ATOM_TITLE = _ATOM + "title"
+_ATOM_ID = _ATOM + "id"
+_ATOM_SUMMARY = _ATOM + "summary"
+_ATOM_AUTHOR = _ATOM + "author"
+_ATOM_NAME = _ATOM + "name"
+_ATOM_PUBLISHED = _ATOM + "published"
+
+
+def _extract_arxiv_entry(entry: Any) -> Dict[str, Any]:
+    """Collect SearchResult fields from an Atom <entry> in one pass over its children."""
+    fields: Dict[str, Any] = {"publication_date": None}
+    authors: List[str] = []
+    for child in entry:
+        tag = child.tag
+        if tag == _ATOM_TITLE:
+            fields["title"] = child.text.strip()
+        elif tag == _ATOM_ID:
+            fields["url"] = child.text
+        elif tag == _ATOM_SUMMARY:
+            fields["content"] = child.text.strip()
+        elif tag == _ATOM_AUTHOR:
+            name = child.find(_ATOM_NAME)
+            if name is not None:
+                authors.append(name.text)
+        elif tag == _ATOM_PUBLISHED:
+            fields["publication_date"] = child.text[:10]
+    fields["author"] = ", ".join(authors)
+    return fields
+
+
+def _extract_pubmed_article(article: Any) -> Dict[str, Any]:
+    """Collect SearchResult fields from a <PubmedArticle> in one pass over its citation.
+
+    The first occurrence of each field in document order wins, matching the
+    MedlineCitation layout (PMID precedes Article, Journal precedes ArticleTitle).
+    """
+    medline = article.find(".//MedlineCitation")
+    if medline is None:
+        raise ValueError("PubmedArticle has no MedlineCitation")
+    pmid = title = abstract = year = journal = None
+    authors: List[str] = []
+    for elem in medline.iter():
+        tag = elem.tag
+        if tag == "PMID":
+            if pmid is None:
+                pmid = elem.text
+        elif tag == "ArticleTitle":
+            if title is None:
+                title = elem.text
+        elif tag == "Abstract":
+            if abstract is None:
+                abstract_text = elem.find("AbstractText")
+                if abstract_text is not None:
+                    abstract = abstract_text.text
+        elif tag == "Journal":
+            if journal is None:
+                journal_title = elem.find("Title")
+                if journal_title is not None:
+                    journal = journal_title.text
+        elif tag == "PubDate":
+            if year is None:
+                year_elem = elem.find("Year")
+                if year_elem is not None:
+                    year = year_elem.text
+        elif tag == "Author":
+            lastname = elem.find("LastName")
+            if lastname is not None:
+                name = lastname.text
+                firstname = elem.find("ForeName")
+                if firstname is not None:
+                    name = f"{firstname.text} {name}"
+                authors.append(name)
+
+    if pmid is None:
+        raise ValueError("PubmedArticle has no PMID")
+
+    return {
+        "title": title or "",
+        "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+        "content": abstract or "",
+        "author": ", ".join(authors[:3]),  # First 3 authors
+        "publication_date": year or "",
+        "venue": journal or "",
+        "metadata": {"pmid": pmid},
+    }
+
+
+# Rate limiting and gateway errors are usually gone on a retry
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransientHTTPError(Exception):
+    """Raised for a response status that is worth retrying."""
+
+    def __init__(self, status: int):
+        super().__init__(f"Transient HTTP status {status}")
+        self.status = status
 
 
 class SearchEngine:
     """Base class for search engine integrations"""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        session: Optional["aiohttp.ClientSession"] = None,
+        max_concurrency: int = 10,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        retry_max_delay: float = 8.0,
+    ):
+        _require_aiohttp()
+
         self.api_key = api_key
         self.timeout = timeout
+        # Built once and reused for every request; connect phases are capped
+        # separately so DNS stalls or half-open sockets fail fast
+        connect_timeout = min(5, timeout)
+        self._timeout = aiohttp.ClientTimeout(
+            total=timeout,
+            connect=connect_timeout,
+            sock_connect=connect_timeout,
+            sock_read=timeout,
+        )
+        self.max_concurrency = max_concurrency
+        # Falls back to the shared session from get_session() when not provided
+        self._session = session
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_max_delay = retry_max_delay
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the in-flight request limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+            self._sem_loop = loop
+        return self._sem
+
+    @contextlib.asynccontextmanager
+    async def _request(
+        self,
+        session: "aiohttp.ClientSession",
+        method: str,
+        url: str,
+        limit: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator["aiohttp.ClientResponse"]:
+        """Open a request, retrying transient failures with jittered exponential backoff.
+
+        Connection errors, timeouts and 429/5xx responses are retried up to
+        ``max_retries`` times. The last response is handed back whatever its
+        status, so callers keep their own status handling. Backoff sleeps
+        happen outside the concurrency slot.
+
+        Args:
+            session: HTTP session to issue the request on
+            method: Session method name ("get" or "post")
+            url: Request URL
+            limit: Hold a concurrency slot for the request; False when the
+                caller already holds one
+            **kwargs: Passed through to the session method
+        """
+        attempt = 0
+        while True:
+            yielded = False
+            try:
+                slot = self._semaphore() if limit else contextlib.nullcontext()
+                async with slot, getattr(session, method)(url, timeout=self._timeout, **kwargs) as response:
+                    if response.status in _TRANSIENT_STATUSES and attempt < self.max_retries:
+                        raise TransientHTTPError(response.status)
+                    yielded = True
+                    yield response
+                    return
+            except (TransientHTTPError, asyncio.TimeoutError, aiohttp.ClientConnectionError) as exc:
+                # Errors raised while the caller reads the body are not retried
+                if yielded or attempt >= self.max_retries:
+                    raise
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_backoff * 2 ** attempt))
+                logger.warning(f"{type(self).__name__} request failed ({exc}); retrying in {delay:.2f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
 
     async def search(
         self,
@@ -109,6 +529,7 @@ class SearchEngine:
 class SemanticScholarSearch(SearchEngine):
     """Semantic Scholar API integration for academic papers"""
 
+    @cached_search(ttl=300)
     async def search(
         self,
         query: str,
@@ -118,8 +539,6 @@ class SemanticScholarSearch(SearchEngine):
     ) -> List[SearchResult]:
         """Search Semantic Scholar"""
         try:
-            import aiohttp
-
             if fields is None:
                 fields = ["title", "abstract", "authors", "year", "citationCount",
                          "venue", "externalIds", "url"]
@@ -135,32 +554,32 @@ class SemanticScholarSearch(SearchEngine):
             if self.api_key:
                 headers["x-api-key"] = self.api_key
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        logger.error(f"Semantic Scholar API error: {response.status}")
-                        return []
-
-                    data = await response.json()
-                    results = []
-
-                    for paper in data.get("data", []):
-                        authors = ", ".join([a.get("name", "") for a in paper.get("authors", [])])
-
-                        result = SearchResult(
-                            title=paper.get("title", ""),
-                            url=paper.get("url", ""),
-                            content=paper.get("abstract", ""),
-                            source_type=SourceType.ACADEMIC_PAPER,
-                            author=authors,
-                            publication_date=str(paper.get("year", "")),
-                            citation_count=paper.get("citationCount", 0),
-                            venue=paper.get("venue", ""),
-                            doi=paper.get("externalIds", {}).get("DOI"),
-                        )
-                        results.append(result)
-
-                    return results
+            session = self._session or await get_session()
+            async with self._request(session, "get", url, params=params, headers=headers) as response:
+                if response.status != 200:
+                    logger.error(f"Semantic Scholar API error: {response.status}")
+                    return []
+
+                data = await response.json(loads=_json_loads)
+                results = []
+
+                for paper in data.get("data", []):
+                    authors = ", ".join([a.get("name", "") for a in paper.get("authors", [])])
+
+                    result = SearchResult(
+                        title=paper.get("title", ""),
+                        url=paper.get("url", ""),
+                        content=paper.get("abstract", ""),
+                        source_type=SourceType.ACADEMIC_PAPER,
+                        author=authors,
+                        publication_date=str(paper.get("year", "")),
+                        citation_count=paper.get("citationCount", 0),
+                        venue=paper.get("venue", ""),
+                        doi=paper.get("externalIds", {}).get("DOI"),
+                    )
+                    results.append(result)
+
+                return results
 
         except Exception as e:
             logger.error(f"Semantic Scholar search error: {e}", exc_info=True)
@@ -170,6 +589,7 @@ class SemanticScholarSearch(SearchEngine):
 class ArXivSearch(SearchEngine):
     """arXiv API integration for preprints"""
 
+    @cached_search(ttl=3600)
     async def search(
         self,
         query: str,
@@ -178,17 +598,6 @@ class ArXivSearch(SearchEngine):
     ) -> List[SearchResult]:
         """Search arXiv"""
         try:
-            # SECURITY: Use defusedxml to prevent XML injection attacks
-            try:
-                from defusedxml import ElementTree as ET
-            except ImportError:
-                # Fallback to standard library with warning
-                import xml.etree.ElementTree as ET
-                import warnings
-                warnings.warn("defusedxml not installed - using standard xml (less secure)", stacklevel=2)
-
-            import aiohttp
-
             url = "http://export.arxiv.org/api/query"
             params = {
                 "search_query": query,
@@ -197,44 +606,20 @@ class ArXivSearch(SearchEngine):
                 "sortOrder": "descending"
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        logger.error(f"arXiv API error: {response.status}")
-                        return []
+            session = self._session or await get_session()
+            async with self._request(session, "get", url, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"arXiv API error: {response.status}")
+                    return []
 
-                    xml_data = await response.text()
-                    root = ET.fromstring(xml_data)
+                xml_data = await response.text()
 
-                    # Parse namespace
-                    ns = {"atom": "http://www.w3.org/2005/Atom"}
+                results = [
+                    SearchResult(source_type=SourceType.PREPRINT, **_extract_arxiv_entry(entry))
+                    for entry in _iter_xml_elements(xml_data, _ATOM + "entry")
+                ]
 
-                    results = []
-                    for entry in root.findall("atom:entry", ns):
-                        title = entry.find("atom:title", ns).text.strip()
-                        url = entry.find("atom:id", ns).text
-                        summary = entry.find("atom:summary", ns).text.strip()
-
-                        authors = []
-                        for author in entry.findall("atom:author", ns):
-                            name = author.find("atom:name", ns)
-                            if name is not None:
-                                authors.append(name.text)
-
-                        published = entry.find("atom:published", ns)
-                        pub_date = published.text[:10] if published is not None else None
-
-                        result = SearchResult(
-                            title=title,
-                            url=url,
-                            content=summary,
-                            source_type=SourceType.PREPRINT,
-                            author=", ".join(authors),
-                            publication_date=pub_date,
-                        )
-                        results.append(result)
-
-                    return results
+                return results
 
         except Exception as e:
             logger.error(f"arXiv search error: {e}", exc_info=True)
@@ -244,6 +629,7 @@ class ArXivSearch(SearchEngine):
 class PubMedSearch(SearchEngine):
     """PubMed API integration for biomedical literature"""
 
+    @cached_search(ttl=3600)
     async def search(
         self,
         query: str,
@@ -252,17 +638,6 @@ class PubMedSearch(SearchEngine):
     ) -> List[SearchResult]:
         """Search PubMed"""
         try:
-            # SECURITY: Use defusedxml to prevent XML injection attacks
-            try:
-                from defusedxml import ElementTree as ET
-            except ImportError:
-                # Fallback to standard library with warning
-                import xml.etree.ElementTree as ET
-                import warnings
-                warnings.warn("defusedxml not installed - using standard xml (less secure)", stacklevel=2)
-
-            import aiohttp
-
             # Step 1: Search to get PMIDs
             search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
             search_params = {
@@ -272,85 +647,50 @@ class PubMedSearch(SearchEngine):
                 "retmode": "json"
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url, params=search_params, timeout=self.timeout) as response:
+            session = self._session or await get_session()
+            # The efetch request below runs while this slot is still held
+            async with self._request(session, "get", search_url, params=search_params) as response:
+                if response.status != 200:
+                    logger.error(f"PubMed search error: {response.status}")
+                    return []
+
+                search_data = await response.json(loads=_json_loads)
+                pmids = search_data.get("esearchresult", {}).get("idlist", [])
+
+                if not pmids:
+                    return []
+
+                # Step 2: Fetch details for PMIDs
+                fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+                fetch_params = {
+                    "db": "pubmed",
+                    "id": ",".join(pmids),
+                    "retmode": "xml"
+                }
+
+                async with self._request(
+                    session, "get", fetch_url, limit=False, params=fetch_params
+                ) as response:
                     if response.status != 200:
-                        logger.error(f"PubMed search error: {response.status}")
+                        logger.error(f"PubMed fetch error: {response.status}")
                         return []
 
-                    search_data = await response.json()
-                    pmids = search_data.get("esearchresult", {}).get("idlist", [])
+                    xml_data = await response.text()
 
-                    if not pmids:
-                        return []
+                    results = []
+                    for article in _iter_xml_elements(xml_data, "PubmedArticle"):
+                        try:
+                            result = SearchResult(
+                                source_type=SourceType.ACADEMIC_PAPER,
+                                **_extract_pubmed_article(article),
+                            )
+                            results.append(result)
+
+                        except Exception as e:
+                            logger.warning(f"Error parsing PubMed article: {e}")
+                            continue
 
-                    # Step 2: Fetch details for PMIDs
-                    fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-                    fetch_params = {
-                        "db": "pubmed",
-                        "id": ",".join(pmids),
-                        "retmode": "xml"
-                    }
-
-                    async with session.get(fetch_url, params=fetch_params, timeout=self.timeout) as response:
-                        if response.status != 200:
-                            logger.error(f"PubMed fetch error: {response.status}")
-                            return []
-
-                        xml_data = await response.text()
-                        root = ET.fromstring(xml_data)
-
-                        results = []
-                        for article in root.findall(".//PubmedArticle"):
-                            try:
-                                medline = article.find(".//MedlineCitation")
-                                article_elem = medline.find(".//Article")
-
-                                title_elem = article_elem.find(".//ArticleTitle")
-                                title = title_elem.text if title_elem is not None else ""
-
-                                abstract_elem = article_elem.find(".//Abstract/AbstractText")
-                                abstract = abstract_elem.text if abstract_elem is not None else ""
-
-                                pmid = medline.find(".//PMID").text
-                                url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-
-                                # Extract authors
-                                authors = []
-                                for author in article_elem.findall(".//Author"):
-                                    lastname = author.find(".//LastName")
-                                    firstname = author.find(".//ForeName")
-                                    if lastname is not None:
-                                        name = lastname.text
-                                        if firstname is not None:
-                                            name = f"{firstname.text} {name}"
-                                        authors.append(name)
-
-                                # Extract year
-                                year_elem = article_elem.find(".//PubDate/Year")
-                                year = year_elem.text if year_elem is not None else ""
-
-                                # Extract journal
-                                journal_elem = article_elem.find(".//Journal/Title")
-                                journal = journal_elem.text if journal_elem is not None else ""
-
-                                result = SearchResult(
-                                    title=title,
-                                    url=url,
-                                    content=abstract,
-                                    source_type=SourceType.ACADEMIC_PAPER,
-                                    author=", ".join(authors[:3]),  # First 3 authors
-                                    publication_date=year,
-                                    venue=journal,
-                                    metadata={"pmid": pmid}
-                                )
-                                results.append(result)
-
-                            except Exception as e:
-                                logger.warning(f"Error parsing PubMed article: {e}")
-                                continue
-
-                        return results
+                    return results
 
         except Exception as e:
             logger.error(f"PubMed search error: {e}", exc_info=True)
@@ -360,6 +700,7 @@ class PubMedSearch(SearchEngine):
 class PerplexitySearch(SearchEngine):
     """Perplexity AI search integration"""
 
+    @cached_search(ttl=300)
     async def search(
         self,
         query: str,
@@ -371,8 +712,6 @@ class PerplexitySearch(SearchEngine):
             return []
 
         try:
-            import aiohttp
-
             url = "https://api.perplexity.ai/search"
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
@@ -383,26 +722,26 @@ class PerplexitySearch(SearchEngine):
                 "max_results": max_results
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=data, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        logger.error(f"Perplexity API error: {response.status}")
-                        return []
+            session = self._session or await get_session()
+            async with self._request(session, "post", url, headers=headers, json=data) as response:
+                if response.status != 200:
+                    logger.error(f"Perplexity API error: {response.status}")
+                    return []
 
-                    result_data = await response.json()
+                result_data = await response.json(loads=_json_loads)
 
-                    # Convert Perplexity results to standard format
-                    results = []
-                    for item in result_data.get("results", [])[:max_results]:
-                        result = SearchResult(
-                            title=item.get("title", ""),
-                            url=item.get("url", ""),
-                            content=item.get("snippet", ""),
-                            source_type=SourceType.WEB_ARTICLE,
-                        )
-                        results.append(result)
+                # Convert Perplexity results to standard format
+                results = []
+                for item in result_data.get("results", [])[:max_results]:
+                    result = SearchResult(
+                        title=item.get("title", ""),
+                        url=item.get("url", ""),
+                        content=item.get("snippet", ""),
+                        source_type=SourceType.WEB_ARTICLE,
+                    )
+                    results.append(result)
 
-                    return results
+                return results
 
         except Exception as e:
             logger.error(f"Perplexity search error: {e}", exc_info=True)
@@ -413,7 +752,11 @@ async def multi_engine_search(
     query: str,
     engines: List[SearchEngine],
     max_results_per_engine: int = 10,
-    deduplicate: bool = True
+    deduplicate: bool = True,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    rank: bool = True,
+    min_results: Optional[int] = None,
+    timeout: Optional[float] = None,
 ) -> List[SearchResult]:
     """Search across multiple engines in parallel.
 
@@ -422,86 +765,338 @@ async def multi_engine_search(
         engines: List of search engine instances
         max_results_per_engine: Max results per engine
         deduplicate: Remove duplicate results
+        semaphore: Optional limiter shared across calls to cap in-flight engine searches
+        rank: Score results with BM25 against the query and sort by that score
+        min_results: Stop waiting for slower engines once this many (unique) results are in
+        timeout: Overall time budget in seconds; engines still running are cancelled
 
     Returns:
         Combined list of search results
     """
-    # Run searches in parallel
-    tasks = [
-        engine.search(query, max_results_per_engine)
-        for engine in engines
-    ]
-
-    results_lists = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _search(index: int, engine: SearchEngine) -> Tuple[int, List[SearchResult]]:
+        # Engine failures are logged here so the only exception as_completed
+        # raises is its own overall timeout
+        try:
+            if semaphore is None:
+                return index, await engine.search(query, max_results_per_engine)
+            async with semaphore:
+                return index, await engine.search(query, max_results_per_engine)
+        except Exception as exc:
+            logger.error(f"Search engine error: {exc}", exc_info=exc)
+            return index, []
+
+    # Run searches in parallel, collecting each engine's results as it finishes
+    tasks = [asyncio.ensure_future(_search(i, engine)) for i, engine in enumerate(engines)]
+    results_by_engine: List[Optional[List[SearchResult]]] = [None] * len(tasks)
+
+    def _combined() -> List[SearchResult]:
+        # Engine order, not completion order, so dedup keeps the same winner
+        return [result for results in results_by_engine if results for result in results]
+
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=timeout):
+            index, results = await next_done
+            results_by_engine[index] = results
+
+            if min_results is not None:
+                combined = _combined()
+                found = len(deduplicate_results(combined) if deduplicate else combined)
+                if found >= min_results:
+                    break
+    except asyncio.TimeoutError:
+        logger.warning(f"Search timed out after {timeout}s; using results from finished engines")
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        # Let cancelled engines unwind (releasing semaphore slots and connections) before returning
+        await asyncio.gather(*pending, return_exceptions=True)
 
     # Combine results
-    all_results = []
-    for results in results_lists:
-        if isinstance(results, list):
-            all_results.extend(results)
-        elif isinstance(results, Exception):
-            logger.error(f"Search engine error: {results}", exc_info=results)
+    all_results = _combined()
 
     # Deduplicate by URL and title similarity
     if deduplicate:
         all_results = deduplicate_results(all_results)
 
+    if rank:
+        score_bm25(query, all_results)
+
     return all_results
 
 
-def deduplicate_results(results: List[SearchResult]) -> List[SearchResult]:
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=256)
+def _bm25_query_terms(query: str) -> Tuple[str, ...]:
+    """Distinct query tokens in order; queries recur across engines and pages, documents do not."""
+    return tuple(dict.fromkeys(_TOKEN_RE.findall(query.lower())))
+
+
+def score_bm25(
+    query: str,
+    results: List[SearchResult],
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> List[SearchResult]:
+    """Score results against a query with Okapi BM25 and sort them in place.
+
+    Documents are the title plus content of each result. Scores are scaled
+    to 0-1 relative to the best match and stored as ``metadata["bm25_score"]``;
+    ``relevance_score`` is left for the search agent's own scoring, which its
+    relevance threshold is calibrated against.
+
+    Args:
+        query: Search query
+        results: Results to score; reordered in place
+        k1: Term frequency saturation
+        b: Document length normalization
+
+    Returns:
+        The same list, sorted by descending BM25 score
+    """
+    query_terms = _bm25_query_terms(query)
+    if not results or not query_terms:
+        return results
+
+    # Only query terms contribute, so term frequencies are an N x |Q| matrix
+    term_column = {term: j for j, term in enumerate(query_terms)}
+    tf: List[List[int]] = []
+    lengths: List[int] = []
+    for result in results:
+        tokens = _TOKEN_RE.findall(f"{result.title} {result.content or ''}".lower())
+        row = [0] * len(query_terms)
+        for token in tokens:
+            j = term_column.get(token)
+            if j is not None:
+                row[j] += 1
+        tf.append(row)
+        lengths.append(len(tokens))
+
+    n_docs = len(results)
+    avgdl = (sum(lengths) / n_docs) or 1.0
+
+    if np is not None:
+        tf_arr = np.asarray(tf, dtype=np.float64)
+        df = np.count_nonzero(tf_arr, axis=0)
+        idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+        norm = k1 * (1.0 - b + b * np.asarray(lengths, dtype=np.float64) / avgdl)
+        scores = ((tf_arr * (k1 + 1.0)) / (tf_arr + norm[:, None])) @ idf
+        scores = scores.tolist()
+    else:
+        df = [sum(1 for row in tf if row[j]) for j in range(len(query_terms))]
+        idf = [math.log((n_docs - d + 0.5) / (d + 0.5) + 1.0) for d in df]
+        scores = []
+        for row, length in zip(tf, lengths):
+            norm = k1 * (1.0 - b + b * length / avgdl)
+            scores.append(sum(
+                w * f * (k1 + 1.0) / (f + norm) for w, f in zip(idf, row) if f
+            ))
+
+    best = max(scores)
+    for result, score in zip(results, scores):
+        result.metadata["bm25_score"] = score / best if best > 0 else 0.0
+
+    results.sort(key=lambda r: r.metadata["bm25_score"], reverse=True)
+    return results
+
+
+def _title_shingles(title: str, size: int = 3) -> Set[str]:
+    """Character shingles of a normalized title."""
+    if len(title) <= size:
+        return {title}
+    return {title[i:i + size] for i in range(len(title) - size + 1)}
+
+
+class _NearDuplicateIndex:
+    """Detects titles whose shingle sets are near-identical to one already seen.
+
+    Uses MinHash LSH from ``datasketch`` when installed to find candidates;
+    otherwise falls back to an inverted shingle index. Either way, candidates
+    are confirmed with exact Jaccard similarity.
+    """
+
+    def __init__(self, threshold: float, num_perm: int = 64):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self._shingle_sets: List[Set[str]] = []
+        if MinHashLSH is not None:
+            # Weighted towards recall; false positives are filtered by the exact check
+            self._lsh = MinHashLSH(threshold=threshold, num_perm=num_perm, weights=(0.1, 0.9))
+        else:
+            self._lsh = None
+            self._postings: Dict[str, List[int]] = {}
+
+    def _is_similar(self, shingles: Set[str], idx: int) -> bool:
+        other = self._shingle_sets[idx]
+        shared = len(shingles & other)
+        return shared / (len(shingles) + len(other) - shared) >= self.threshold
+
+    def add_if_new(self, title: str) -> bool:
+        """Record the title and return True unless a near-duplicate was already seen."""
+        shingles = _title_shingles(title)
+
+        if self._lsh is not None:
+            minhash = MinHash(num_perm=self.num_perm)
+            for shingle in shingles:
+                minhash.update(shingle.encode("utf-8"))
+            if any(self._is_similar(shingles, int(key)) for key in self._lsh.query(minhash)):
+                return False
+            self._lsh.insert(str(len(self._shingle_sets)), minhash)
+            self._shingle_sets.append(shingles)
+            return True
+
+        # Count shared shingles per candidate, then check exact Jaccard
+        overlap: Dict[int, int] = {}
+        for shingle in shingles:
+            for idx in self._postings.get(shingle, ()):
+                overlap[idx] = overlap.get(idx, 0) + 1
+        for idx, shared in overlap.items():
+            union = len(shingles) + len(self._shingle_sets[idx]) - shared
+            if shared / union >= self.threshold:
+                return False
+
+        idx = len(self._shingle_sets)
+        self._shingle_sets.append(shingles)
+        for shingle in shingles:
+            self._postings.setdefault(shingle, []).append(idx)
+        return True
+
+
+# Title keys keep only letters and digits; URL keys drop utm_* tracking params
+_NORM_RE = re.compile(r"[\W_]+")
+_URL_RE = re.compile(r"(?<=[?&])utm_[^&#]*(?:&|(?=#)|$)")
+# A "?" or "&" left in front of the fragment once the params after it are gone
+_URL_DANGLING_RE = re.compile(r"[?&]+(?=#)")
+
+
+def _title_key(title: str) -> str:
+    return _NORM_RE.sub(" ", title.lower()).strip()
+
+
+def _url_key(url: str) -> str:
+    return _URL_DANGLING_RE.sub("", _URL_RE.sub("", url)).rstrip("?&/")
+
+
+def deduplicate_results(
+    results: List[SearchResult],
+    near_duplicate_threshold: Optional[float] = 0.85,
+) -> List[SearchResult]:
     """Remove duplicate search results based on URL and title similarity.
 
+    Exact URL and normalized-title matches are dropped first; remaining
+    results are compared on 3-character title shingles to catch near
+    duplicates such as minor wording changes. Titles are compared without
+    case or punctuation and URLs without utm_* parameters or a trailing slash.
+
     Args:
         results: List of search results
+        near_duplicate_threshold: Jaccard similarity at which titles count as
+            duplicates, or None to only drop exact matches
 
     Returns:
         Deduplicated list of results
     """
     seen_urls: Set[str] = set()
-    seen_title_hashes: Set[str] = set()
-    unique_results = []
+    seen_titles: Set[str] = set()
+    add_url = seen_urls.add
+    add_title = seen_titles.add
+    unique_results: List[SearchResult] = []
+    keep = unique_results.append
+
+    # The near-duplicate index only pays off once there is something to compare
+    is_new_title = None
+    if near_duplicate_threshold is not None and len(results) > 1:
+        is_new_title = _NearDuplicateIndex(near_duplicate_threshold).add_if_new
 
     for result in results:
-        # Check URL
-        if result.url in seen_urls:
+        url = _url_key(result.url)
+        if url in seen_urls:
             continue
 
-        # Check title similarity (fuzzy matching via hash)
-        title_normalized = result.title.lower().strip()
-        title_hash = hashlib.md5(title_normalized.encode()).hexdigest()
-
-        if title_hash in seen_title_hashes:
-            continue
+        # Titles with no letters or digits are never treated as duplicates
+        title_key = _title_key(result.title)
+        if title_key:
+            if title_key in seen_titles:
+                continue
+            if is_new_title is not None and not is_new_title(title_key):
+                continue
+            add_title(title_key)
 
-        seen_urls.add(result.url)
-        seen_title_hashes.add(title_hash)
-        unique_results.append(result)
+        add_url(url)
+        keep(result)
 
     return unique_results
 
 
+async def batch_search_queries_async(
+    queries: List[str],
+    engines: List[SearchEngine],
+    max_results_per_query: int = 10,
+    max_concurrent_queries: int = 10,
+) -> Dict[str, List[SearchResult]]:
+    """Execute multiple search queries in parallel on the running event loop.
+
+    All queries share the engines' HTTP session, so connections are reused
+    across the whole batch.
+
+    Args:
+        queries: List of search queries
+        engines: List of search engine instances
+        max_results_per_query: Max results per query
+        max_concurrent_queries: Max queries in flight at once
+
+    Returns:
+        Dictionary mapping queries to search results
+    """
+    query_sem = asyncio.Semaphore(max_concurrent_queries)
+
+    async def _search(query: str) -> List[SearchResult]:
+        async with query_sem:
+            return await multi_engine_search(query, engines, max_results_per_query)
+
+    results_lists = await asyncio.gather(*(_search(query) for query in queries))
+    return dict(zip(queries, results_lists, strict=False))
+
+
 def batch_search_queries(
     queries: List[str],
     engines: List[SearchEngine],
-    max_results_per_query: int = 10
+    max_results_per_query: int = 10,
+    max_concurrent_queries: int = 10,
 ) -> Dict[str, List[SearchResult]]:
-    """Execute multiple search queries in parallel.
+    """Synchronous wrapper around :func:`batch_search_queries_async`.
+
+    Must not be called from a running event loop; await
+    ``batch_search_queries_async`` there instead.
 
     Args:
         queries: List of search queries
         engines: List of search engine instances
         max_results_per_query: Max results per query
+        max_concurrent_queries: Max queries in flight at once
 
     Returns:
         Dictionary mapping queries to search results
     """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "batch_search_queries() cannot run inside an event loop; "
+            "await batch_search_queries_async() instead"
+        )
+
     async def _batch_search():
-        tasks = [
-            multi_engine_search(query, engines, max_results_per_query)
-            for query in queries
-        ]
-        results_lists = await asyncio.gather(*tasks)
-        return dict(zip(queries, results_lists, strict=False))
+        try:
+            return await batch_search_queries_async(
+                queries, engines, max_results_per_query, max_concurrent_queries
+            )
+        finally:
+            # The shared session is bound to this short-lived event loop
+            await close_session()
 
     return asyncio.run(_batch_search())
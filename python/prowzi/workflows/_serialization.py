@@ -0,0 +1,48 @@
+"""File and JSON helpers shared by checkpoint and telemetry persistence."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize values the JSON and msgpack encoders do not handle natively."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple, deque)):
+        return list(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file.
+
+    Not fsynced: a crash may lose the write, but never tears it.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def load_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
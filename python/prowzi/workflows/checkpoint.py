@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import functools
+import gzip
 import json
 import logging
+import os
+import threading
+import types
+import typing
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from prowzi.agents.evaluation_agent import EvaluationAgentResult
 from prowzi.agents.intent_agent import IntentAnalysis
@@ -16,10 +25,138 @@ from prowzi.agents.search_agent import SearchAgentResult
 from prowzi.agents.turnitin_agent import TurnitinAgentResult
 from prowzi.agents.verification_agent import VerificationAgentResult
 from prowzi.agents.writing_agent import WritingAgentResult
+from prowzi.workflows._serialization import json_default, load_json, write_atomic
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
 
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Encode checkpoint data as compact (or indented) UTF-8 JSON, dataclasses included."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=json_default, option=option)
+    if pretty:
+        return json.dumps(data, default=json_default, indent=2).encode("utf-8")
+    return json.dumps(data, default=json_default, separators=(",", ":")).encode("utf-8")
+
+
+# Stage payloads are gzipped msgpack when available; ".pkl" holds the legacy
+# JSON payload and is still read for older checkpoints
+_MSGPACK_SUFFIX = ".mpz"
+_JSON_SUFFIX = ".pkl"
+
+
+def _dump_payload(data: Any) -> bytes:
+    """Encode a checkpoint payload as gzipped msgpack."""
+    packed = msgpack.packb(data, default=json_default, use_bin_type=True)
+    return gzip.compress(packed, compresslevel=6)
+
+
+def _load_payload(path: Path) -> Any:
+    """Decode a checkpoint payload written in either format."""
+    if path.suffix == _MSGPACK_SUFFIX:
+        return msgpack.unpackb(gzip.decompress(path.read_bytes()), raw=False, strict_map_key=False)
+    return load_json(path.read_bytes())
+
+
+# Incremental checkpoints append to one log per session: gzip members of
+# msgpack records when available, JSON lines otherwise
+_DELTA_LOG_MSGPACK_SUFFIX = ".deltas.mpz"
+_DELTA_LOG_JSON_SUFFIX = ".deltas.jsonl"
+
+# Agent-result fields of a checkpoint payload, in pipeline order
+_PAYLOAD_FIELDS = (
+    "intent",
+    "plan",
+    "search",
+    "verification",
+    "draft",
+    "evaluation",
+    "initial_evaluation",
+    "turnitin",
+)
+
+
+def _dump_delta_record(record: Dict[str, Any]) -> bytes:
+    """Encode one delta-log record so it can be appended to the log as-is."""
+    if msgpack is not None:
+        return _dump_payload(record)
+    return json.dumps(record, default=json_default, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _iter_delta_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a delta log in the order they were appended."""
+    data = path.read_bytes()
+    if path.name.endswith(_DELTA_LOG_MSGPACK_SUFFIX):
+        # Concatenated gzip members decompress as one stream
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(gzip.decompress(data))
+        yield from unpacker
+        return
+    for line in data.splitlines():
+        if line:
+            yield load_json(line)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_types(cls: type) -> Dict[str, Any]:
+    return typing.get_type_hints(cls)
+
+
+def _restore_value(annotation: Any, value: Any) -> Any:
+    """Rebuild a decoded payload value as the type it was annotated with.
+
+    Payloads are stored as plain data, so nested agent-result dataclasses,
+    enums and datetimes come back as dicts and strings. Values that do not
+    match their annotation are returned as decoded.
+    """
+    if value is None:
+        return None
+    origin = typing.get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        options = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _restore_value(options[0], value) if len(options) == 1 else value
+    if origin is list and isinstance(value, list):
+        (item_type,) = typing.get_args(annotation) or (Any,)
+        return [_restore_value(item_type, item) for item in value]
+    if origin is dict and isinstance(value, dict):
+        _, value_type = typing.get_args(annotation) or (Any, Any)
+        return {key: _restore_value(value_type, item) for key, item in value.items()}
+    if not isinstance(annotation, type):
+        return value
+    if dataclasses.is_dataclass(annotation) and isinstance(value, dict):
+        hints = _field_types(annotation)
+        return annotation(
+            **{
+                f.name: _restore_value(hints[f.name], value[f.name])
+                for f in dataclasses.fields(annotation)
+                if f.init and f.name in value
+            }
+        )
+    if issubclass(annotation, Enum) and not isinstance(value, annotation):
+        return annotation(value)
+    if annotation is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
 @dataclass
 class CheckpointMetadata:
     """Metadata about a checkpoint."""
@@ -52,10 +189,19 @@ class WorkflowCheckpoint:
 class CheckpointManager:
     """Manages workflow checkpoints for resumability."""
 
-    def __init__(self, checkpoint_dir: Path, enabled: bool = True) -> None:
+    def __init__(self, checkpoint_dir: Path, enabled: bool = True, pretty: bool = False) -> None:
         self.checkpoint_dir = checkpoint_dir
         self.enabled = enabled
+        # Indent JSON files for manual inspection; compact by default
+        self.pretty = pretty
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        # checkpoint_id -> metadata dict, mirrored to _index.json on every change
+        self._index_path = self.checkpoint_dir / "_index.json"
+        # Held (where fcntl exists) while another manager's index update is read, merged and replaced
+        self._index_lock_path = self.checkpoint_dir / "_index.lock"
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        # Saves may run in worker threads; guards _index and _index.json
+        self._index_lock = threading.Lock()
 
     def save_checkpoint(
         self,
@@ -71,7 +217,8 @@ class CheckpointManager:
             return ""
 
         checkpoint_id = self._generate_checkpoint_id(session_id, stage)
-        checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.pkl"
+        payload_suffix = _MSGPACK_SUFFIX if msgpack is not None else _JSON_SUFFIX
+        checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}{payload_suffix}"
         metadata_path = self.checkpoint_dir / f"{checkpoint_id}.json"
 
         checkpoint_meta = CheckpointMetadata(
@@ -98,20 +245,22 @@ class CheckpointManager:
 
         try:
             # SECURITY: Use JSON instead of pickle to prevent arbitrary code execution
-            # Convert dataclasses to dict for JSON serialization
+            # Nested agent results are dataclasses and are encoded directly
             checkpoint_dict = {
-                "intent": checkpoint.intent.__dict__ if hasattr(checkpoint.intent, '__dict__') else checkpoint.intent,
-                "plan": checkpoint.plan.__dict__ if hasattr(checkpoint.plan, '__dict__') else checkpoint.plan,
-                "search_results": checkpoint.search_results,
-                "verification": checkpoint.verification.__dict__ if hasattr(checkpoint.verification, '__dict__') else checkpoint.verification,
-                "draft": checkpoint.draft.__dict__ if hasattr(checkpoint.draft, '__dict__') else checkpoint.draft,
-                "initial_evaluation": checkpoint.initial_evaluation.__dict__ if hasattr(checkpoint.initial_evaluation, '__dict__') else checkpoint.initial_evaluation,
+                "intent": checkpoint.intent,
+                "plan": checkpoint.plan,
+                "search": checkpoint.search,
+                "verification": checkpoint.verification,
+                "draft": checkpoint.draft,
+                "evaluation": checkpoint.evaluation,
+                "initial_evaluation": checkpoint.initial_evaluation,
                 "turnitin": checkpoint.turnitin,
                 "stage_metrics": checkpoint.stage_metrics,
             }
-
-            with open(checkpoint_path, "w", encoding="utf-8") as f:
-                json.dump(checkpoint_dict, f, indent=2)
+            if msgpack is not None:
+                write_atomic(checkpoint_path, _dump_payload(checkpoint_dict))
+            else:
+                write_atomic(checkpoint_path, _dump_json(checkpoint_dict, self.pretty))
 
             metadata_dict = {
                 "checkpoint_id": checkpoint_meta.checkpoint_id,
@@ -121,8 +270,9 @@ class CheckpointManager:
                 "prompt": checkpoint_meta.prompt,
                 "stage_metrics": checkpoint_meta.stage_metrics,
             }
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata_dict, f, indent=2)
+            write_atomic(metadata_path, _dump_json(metadata_dict, self.pretty))
+            with self._update_index() as index:
+                index[checkpoint_id] = metadata_dict
 
             logger.info("Checkpoint saved: %s (stage: %s)", checkpoint_id, stage)
             return checkpoint_id
@@ -131,22 +281,94 @@ class CheckpointManager:
             logger.exception("Failed to save checkpoint %s: %s", checkpoint_id, exc)
             return ""
 
+    def save_delta(
+        self,
+        session_id: str,
+        stage: str,
+        prompt: str,
+        new_fields: Dict[str, Any],
+        stage_metrics: Dict[str, Any],
+    ) -> str:
+        """Save a checkpoint holding only the fields changed since the session's last save.
+
+        The delta is appended to the session's log, so each stage writes its own
+        results once instead of re-serializing every earlier stage's results too.
+        Loading the checkpoint replays the log up to and including this record.
+        """
+        if not self.enabled:
+            logger.debug("Checkpointing disabled; skipping save.")
+            return ""
+
+        checkpoint_id = self._generate_checkpoint_id(session_id, stage)
+        log_suffix = _DELTA_LOG_MSGPACK_SUFFIX if msgpack is not None else _DELTA_LOG_JSON_SUFFIX
+        log_path = self.checkpoint_dir / f"{session_id}{log_suffix}"
+        metadata_path = self.checkpoint_dir / f"{checkpoint_id}.json"
+
+        try:
+            record = {
+                "checkpoint_id": checkpoint_id,
+                "stage": stage,
+                "fields": new_fields,
+                "stage_metrics": stage_metrics,
+            }
+            with open(log_path, "ab") as f:
+                f.write(_dump_delta_record(record))
+
+            metadata_dict = {
+                "checkpoint_id": checkpoint_id,
+                "session_id": session_id,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "stage": stage,
+                "prompt": prompt[:500],
+                "stage_metrics": stage_metrics,
+                "delta_log": log_path.name,
+            }
+            write_atomic(metadata_path, _dump_json(metadata_dict, self.pretty))
+            with self._update_index() as index:
+                index[checkpoint_id] = metadata_dict
+
+            logger.info("Checkpoint delta saved: %s (stage: %s)", checkpoint_id, stage)
+            return checkpoint_id
+
+        except Exception as exc:
+            logger.exception("Failed to save checkpoint delta %s: %s", checkpoint_id, exc)
+            return ""
+
     def load_checkpoint(self, checkpoint_id: str) -> Optional[WorkflowCheckpoint]:
-        """Load a workflow checkpoint."""
+        """Load a workflow checkpoint with its metadata and typed agent results."""
         if not self.enabled:
             logger.warning("Checkpointing disabled; cannot load.")
             return None
 
-        checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.pkl"
-        if not checkpoint_path.exists():
+        with self._index_lock:
+            entry = self._index.get(checkpoint_id)
+        if entry is None:
+            # Saved by another manager after this one read the index
+            entry = self._read_metadata(checkpoint_id)
+        if entry is None:
             logger.error("Checkpoint not found: %s", checkpoint_id)
             return None
 
         try:
-            # SECURITY: Use JSON instead of pickle to prevent arbitrary code execution
-            # pickle.load() can execute malicious code - JSON is safe
-            with open(checkpoint_path, "r", encoding="utf-8") as f:
-                checkpoint = json.load(f)
+            delta_log = entry.get("delta_log")
+            if delta_log:
+                payload = self._replay_delta_log(self.checkpoint_dir / delta_log, checkpoint_id)
+            else:
+                checkpoint_path = self._payload_path(checkpoint_id)
+                if checkpoint_path is None:
+                    logger.error("Checkpoint payload not found: %s", checkpoint_id)
+                    return None
+                # SECURITY: Use msgpack/JSON instead of pickle to prevent arbitrary code execution
+                # pickle.load() can execute malicious code - msgpack and JSON are data-only
+                payload = _load_payload(checkpoint_path)
+
+            checkpoint = WorkflowCheckpoint(
+                metadata=self._metadata_from_entry(entry),
+                stage_metrics=payload.get("stage_metrics") or {},
+            )
+            hints = _field_types(WorkflowCheckpoint)
+            for name in _PAYLOAD_FIELDS:
+                setattr(checkpoint, name, _restore_value(hints[name], payload.get(name)))
             logger.info("Checkpoint loaded: %s", checkpoint_id)
             return checkpoint
         except Exception as exc:
@@ -158,24 +380,21 @@ class CheckpointManager:
         if not self.enabled:
             return []
 
+        # Pick up checkpoints other managers have saved since
+        disk_index = self._read_index()
+        with self._index_lock:
+            if disk_index is not None:
+                self._index = disk_index
+            entries = list(self._index.values())
+
         checkpoints: List[CheckpointMetadata] = []
-        for metadata_path in self.checkpoint_dir.glob("*.json"):
+        for data in entries:
+            if session_id is not None and data.get("session_id") != session_id:
+                continue
             try:
-                with open(metadata_path) as f:
-                    data = json.load(f)
-                if session_id is None or data.get("session_id") == session_id:
-                    checkpoints.append(
-                        CheckpointMetadata(
-                            checkpoint_id=data["checkpoint_id"],
-                            session_id=data["session_id"],
-                            created_at=datetime.fromisoformat(data["created_at"]),
-                            stage=data["stage"],
-                            prompt=data["prompt"],
-                            stage_metrics=data.get("stage_metrics", {}),
-                        )
-                    )
+                checkpoints.append(self._metadata_from_entry(data))
             except Exception as exc:
-                logger.warning("Failed to read checkpoint metadata %s: %s", metadata_path, exc)
+                logger.warning("Invalid checkpoint index entry %s: %s", data.get("checkpoint_id"), exc)
 
         return sorted(checkpoints, key=lambda c: c.created_at, reverse=True)
 
@@ -184,20 +403,120 @@ class CheckpointManager:
         if not self.enabled:
             return False
 
-        checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.pkl"
         metadata_path = self.checkpoint_dir / f"{checkpoint_id}.json"
 
         try:
-            if checkpoint_path.exists():
-                checkpoint_path.unlink()
+            for suffix in (_MSGPACK_SUFFIX, _JSON_SUFFIX):
+                checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}{suffix}"
+                if checkpoint_path.exists():
+                    checkpoint_path.unlink()
             if metadata_path.exists():
                 metadata_path.unlink()
+            with self._update_index() as index:
+                entry = index.pop(checkpoint_id, None)
+                # Later checkpoints of the session replay the same log; drop it with the last one
+                delta_log = entry.get("delta_log") if entry is not None else None
+                if delta_log and not any(e.get("delta_log") == delta_log for e in index.values()):
+                    (self.checkpoint_dir / delta_log).unlink(missing_ok=True)
             logger.info("Checkpoint deleted: %s", checkpoint_id)
             return True
         except Exception as exc:
             logger.exception("Failed to delete checkpoint %s: %s", checkpoint_id, exc)
             return False
 
+    @staticmethod
+    def _metadata_from_entry(data: Dict[str, Any]) -> CheckpointMetadata:
+        return CheckpointMetadata(
+            checkpoint_id=data["checkpoint_id"],
+            session_id=data["session_id"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            stage=data["stage"],
+            prompt=data["prompt"],
+            stage_metrics=data.get("stage_metrics", {}),
+        )
+
+    def _payload_path(self, checkpoint_id: str) -> Optional[Path]:
+        """Return the existing payload file for a checkpoint, newest format first."""
+        suffixes = (_MSGPACK_SUFFIX, _JSON_SUFFIX) if msgpack is not None else (_JSON_SUFFIX,)
+        for suffix in suffixes:
+            path = self.checkpoint_dir / f"{checkpoint_id}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def _replay_delta_log(log_path: Path, checkpoint_id: str) -> Dict[str, Any]:
+        """Rebuild a checkpoint payload by applying a session's deltas in order."""
+        payload: Dict[str, Any] = dict.fromkeys(_PAYLOAD_FIELDS)
+        payload["stage_metrics"] = {}
+        for record in _iter_delta_records(log_path):
+            payload.update(record["fields"])
+            payload["stage_metrics"] = record["stage_metrics"]
+            if record["checkpoint_id"] == checkpoint_id:
+                return payload
+        raise ValueError(f"Checkpoint {checkpoint_id} missing from delta log {log_path.name}")
+
+    def _read_metadata(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """Read a checkpoint's own metadata file, or None if it has none."""
+        try:
+            return load_json((self.checkpoint_dir / f"{checkpoint_id}.json").read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Failed to read checkpoint metadata %s: %s", checkpoint_id, exc)
+            return None
+
+    def _read_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read _index.json as currently on disk, or None if it is missing or unreadable."""
+        try:
+            return load_json(self._index_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Failed to read checkpoint index: %s", exc)
+            return None
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the checkpoint index, rebuilding it from metadata files if absent."""
+        index = self._read_index()
+        if index is not None:
+            return index
+
+        index: Dict[str, Dict[str, Any]] = {}
+        with os.scandir(self.checkpoint_dir) as it:
+            # Underscore-prefixed files (the index itself) are not checkpoint metadata
+            metadata_paths = [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".json") and not entry.name.startswith("_") and entry.is_file()
+            ]
+        for metadata_path in metadata_paths:
+            try:
+                with open(metadata_path, "rb") as f:
+                    data = load_json(f.read())
+                index[data["checkpoint_id"]] = data
+            except Exception as exc:
+                logger.warning("Failed to read checkpoint metadata %s: %s", metadata_path, exc)
+        return index
+
+    @contextlib.contextmanager
+    def _update_index(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Yield the index as currently on disk, then atomically write back the caller's changes.
+
+        Other managers (in this process or another) may have updated _index.json
+        since this one loaded it, so changes are applied to a fresh read rather
+        than to the in-memory copy, which would drop theirs.
+        """
+        with self._index_lock, open(self._index_lock_path, "ab") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            index = self._read_index()
+            if index is None:
+                index = dict(self._index)
+            yield index
+            write_atomic(self._index_path, _dump_json(index, self.pretty))
+            self._index = index
+
     @staticmethod
     def _generate_checkpoint_id(session_id: str, stage: str) -> str:
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import json
 import logging
-import time
+import random
+import sys
 import uuid
-from dataclasses import asdict, dataclass, field
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, is_dataclass
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
 
 from prowzi.agents.evaluation_agent import EvaluationAgent, EvaluationAgentResult
 from prowzi.agents.intent_agent import IntentAgent, IntentAnalysis
@@ -18,6 +24,7 @@ from prowzi.agents.turnitin_agent import TurnitinAgent, TurnitinAgentResult, Tur
 from prowzi.agents.verification_agent import VerificationAgent, VerificationAgentResult
 from prowzi.agents.writing_agent import WritingAgent, WritingAgentResult
 from prowzi.config import ProwziConfig, get_config
+from prowzi.tools.search_tools import close_session
 from prowzi.workflows.checkpoint import CheckpointManager, WorkflowCheckpoint
 from prowzi.workflows.telemetry import TelemetryCollector
 
@@ -25,12 +32,103 @@ logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
 
+_T = TypeVar("_T")
+
+# Session of the run_research call the current task belongs to; the stage
+# tasks, background workers and their threads all inherit it
+_SESSION_ID: ContextVar[str] = ContextVar("prowzi_session_id")
+
+# (stage_name, prompt, context snapshot) awaiting persistence
+_CheckpointJob = Tuple[str, str, Dict[str, Any]]
+
+# Progress events buffered ahead of a slow callback before stages start waiting on it
+_PROGRESS_QUEUE_SIZE = 64
+
+# Agent results a checkpoint carries; only the ones a stage changed are re-saved
+_CHECKPOINT_FIELDS = (
+    "intent",
+    "plan",
+    "search",
+    "verification",
+    "draft",
+    "evaluation",
+    "initial_evaluation",
+    "turnitin",
+)
+
 
 def _new_dict() -> Dict[str, Any]:
     return {}
 
 
-@dataclass
+def _fingerprint_default(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def _draft_fingerprint(draft: WritingAgentResult) -> Optional[str]:
+    """Digest of a draft's content, used to spot a re-evaluation of an identical document.
+
+    Returns None when the draft cannot be encoded, which never matches.
+    """
+    try:
+        encoded = json.dumps(draft, default=_fingerprint_default, sort_keys=True, separators=(",", ":"))
+    except TypeError:
+        # Dicts mixing key types cannot be sorted; their insertion order is deterministic enough
+        try:
+            encoded = json.dumps(draft, default=_fingerprint_default, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+    except ValueError:
+        return None
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+if sys.version_info >= (3, 12):
+
+    def _create_task(coro: Coroutine[Any, Any, _T]) -> "asyncio.Task[_T]":
+        """Start a task eagerly: it runs synchronously until its first real suspension."""
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+
+else:
+    _create_task = asyncio.create_task
+
+
+class _NullTelemetry:
+    """No-op stand-in for TelemetryCollector when telemetry is disabled.
+
+    It lets the stage loop record events unconditionally. It is falsy, so
+    ``if orchestrator.telemetry_collector:`` still reads as "disabled".
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def start_session(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def record_stage_event(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def complete_session(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def get_session_metrics(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+async def _no_progress(stage: str, payload: Dict[str, Any]) -> None:
+    """Progress sink used when the caller passed no progress callback."""
+    return None
+
+
+@dataclass(slots=True)
 class ProwziOrchestrationResult:
     """Aggregated results from the full research pipeline."""
 
@@ -44,7 +142,7 @@ class ProwziOrchestrationResult:
     metadata: Dict[str, Any] = field(default_factory=_new_dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class _StageExecutionStats:
     name: str
     attempts: int = 0
@@ -55,16 +153,29 @@ class _StageExecutionStats:
     details: Dict[str, Any] = field(default_factory=_new_dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class _StageSpec:
     name: str
     executor: Callable[["_StageContext"], Awaitable[Tuple[Dict[str, Any], Dict[str, Any]]]]
     max_retries: int = 1
     retry_backoff: float = 1.5
     predicate: Optional[Callable[["_StageContext"], bool]] = None
-
-
-@dataclass
+    # Stages whose results this stage reads; it starts as soon as all have finished
+    depends_on: Tuple[str, ...] = ()
+    event_start: str = field(init=False)
+    event_retry: str = field(init=False)
+    event_skipped: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Names are dict keys and event strings for the whole run; formatted
+        # strings are not interned automatically, so intern them here
+        self.name = sys.intern(self.name)
+        self.event_start = sys.intern(f"{self.name}_start")
+        self.event_retry = sys.intern(f"{self.name}_retry")
+        self.event_skipped = sys.intern(f"{self.name}_skipped")
+
+
+@dataclass(slots=True)
 class _StageContext:
     prompt: str
     document_paths: Optional[List[str | Path]]
@@ -83,6 +194,8 @@ class _StageContext:
     initial_evaluation: Optional[EvaluationAgentResult] = None
     turnitin: Optional[TurnitinAgentResult] = None
     stage_metrics: Dict[str, Any] = field(default_factory=_new_dict)
+    # The draft initial_evaluation scored; not checkpointed, so a resumed run re-evaluates
+    evaluated_draft: Optional[WritingAgentResult] = None
 
 
 class ProwziOrchestrator:
@@ -110,27 +223,51 @@ class ProwziOrchestrator:
             self.telemetry_collector = TelemetryCollector(output_dir=telemetry_dir)
             logger.info("Telemetry collection enabled at: %s", telemetry_dir)
         else:
-            self.telemetry_collector = None
+            self.telemetry_collector = _NullTelemetry()
 
-        self._stage_specs: List[_StageSpec] = [
+        stage_specs = [
             _StageSpec(name="intent", executor=self._stage_intent, max_retries=2),
-            _StageSpec(name="planning", executor=self._stage_planning, max_retries=2),
-            _StageSpec(name="search", executor=self._stage_search, max_retries=3, retry_backoff=2.0),
-            _StageSpec(name="verification", executor=self._stage_verification, max_retries=2),
-            _StageSpec(name="writing", executor=self._stage_writing, max_retries=2),
-            _StageSpec(name="evaluation", executor=self._stage_evaluation, max_retries=2),
+            _StageSpec(
+                name="planning", executor=self._stage_planning, max_retries=2, depends_on=("intent",)
+            ),
+            _StageSpec(
+                name="search",
+                executor=self._stage_search,
+                max_retries=3,
+                retry_backoff=2.0,
+                depends_on=("planning",),
+            ),
+            _StageSpec(
+                name="verification",
+                executor=self._stage_verification,
+                max_retries=2,
+                depends_on=("search",),
+            ),
+            _StageSpec(
+                name="writing", executor=self._stage_writing, max_retries=2, depends_on=("verification",)
+            ),
+            _StageSpec(
+                name="evaluation", executor=self._stage_evaluation, max_retries=2, depends_on=("writing",)
+            ),
             _StageSpec(
                 name="turnitin",
                 executor=self._stage_turnitin,
                 max_retries=max(2, getattr(self.turnitin_agent, "max_attempts", 2)),
+                depends_on=("evaluation",),
             ),
             _StageSpec(
                 name="post_turnitin_evaluation",
                 executor=self._stage_post_turnitin_evaluation,
                 predicate=self._should_run_post_turnitin_evaluation,
                 max_retries=2,
+                depends_on=("turnitin",),
             ),
         ]
+        # Declaration order is the resume order: a checkpoint at stage N skips stages 0..N
+        self._stage_specs: Dict[str, _StageSpec] = {spec.name: spec for spec in stage_specs}
+        self._stage_index: Dict[str, int] = {name: idx for idx, name in enumerate(self._stage_specs)}
+        # One per in-flight run; cancel() sets them all to cut retry backoffs short
+        self._cancel_events: Set[asyncio.Event] = set()
 
     async def run_research(
         self,
@@ -144,44 +281,39 @@ class ProwziOrchestrator:
         thresholds: Optional[TurnitinThresholds] = None,
         progress_callback: Optional[ProgressCallback] = None,
         checkpoint_id: Optional[str] = None,
+        _checkpoint: Optional[WorkflowCheckpoint] = None,
     ) -> ProwziOrchestrationResult:
         """Execute the complete pipeline with retries, metrics, checkpoints, and telemetry."""
+        # resume_from_checkpoint has already loaded the checkpoint; don't load it twice
+        checkpoint: Optional[WorkflowCheckpoint] = _checkpoint
+        if checkpoint is not None:
+            checkpoint_id = checkpoint.metadata.checkpoint_id
+
         # Generate session ID
         session_id = checkpoint_id or str(uuid.uuid4())
 
         # Start telemetry
-        if self.telemetry_collector:
-            self.telemetry_collector.start_session(session_id=session_id, prompt=prompt)
+        self.telemetry_collector.start_session(session_id=session_id, prompt=prompt)
 
         # Try to resume from checkpoint
-        if checkpoint_id and self.checkpoint_manager:
+        if checkpoint is None and checkpoint_id and self.checkpoint_manager:
             logger.info("Attempting to resume from checkpoint: %s", checkpoint_id)
             checkpoint = self.checkpoint_manager.load_checkpoint(checkpoint_id)
-            if checkpoint:
-                context = self._restore_context_from_checkpoint(
-                    checkpoint=checkpoint,
-                    prompt=prompt,
-                    document_paths=document_paths,
-                    additional_context=additional_context,
-                    custom_constraints=custom_constraints,
-                    max_results_per_query=max_results_per_query,
-                    max_sections=max_sections,
-                    thresholds=thresholds,
-                    progress_callback=progress_callback,
-                )
-                logger.info("Resumed from checkpoint at stage: %s", checkpoint.metadata.stage)
-            else:
+            if checkpoint is None:
                 logger.warning("Checkpoint %s not found, starting fresh", checkpoint_id)
-                context = _StageContext(
-                    prompt=prompt,
-                    document_paths=document_paths,
-                    additional_context=additional_context,
-                    custom_constraints=custom_constraints,
-                    max_results_per_query=max_results_per_query,
-                    max_sections=max_sections,
-                    thresholds=thresholds,
-                    progress_callback=progress_callback,
-                )
+        if checkpoint:
+            context = self._restore_context_from_checkpoint(
+                checkpoint=checkpoint,
+                prompt=prompt,
+                document_paths=document_paths,
+                additional_context=additional_context,
+                custom_constraints=custom_constraints,
+                max_results_per_query=max_results_per_query,
+                max_sections=max_sections,
+                thresholds=thresholds,
+                progress_callback=progress_callback,
+            )
+            logger.info("Resumed from checkpoint at stage: %s", checkpoint.metadata.stage)
         else:
             context = _StageContext(
                 prompt=prompt,
@@ -194,114 +326,184 @@ class ProwziOrchestrator:
                 progress_callback=progress_callback,
             )
 
-        stage_stats: List[_StageExecutionStats] = []
-        workflow_start = time.perf_counter()
+        # The loop's monotonic clock; every duration below is measured with it
+        now = asyncio.get_running_loop().time
+        workflow_start = now()
 
-        # Determine starting stage index for resume
+        # Determine completed stages for resume
         start_stage_idx = 0
-        if checkpoint_id and self.checkpoint_manager:
-            checkpoint = self.checkpoint_manager.load_checkpoint(checkpoint_id)
-            if checkpoint:
-                for idx, spec in enumerate(self._stage_specs):
-                    if spec.name == checkpoint.metadata.stage:
-                        start_stage_idx = idx + 1
-                        break
-
-        for idx, spec in enumerate(self._stage_specs):
-            if idx < start_stage_idx:
-                logger.info("Skipping already completed stage: %s", spec.name)
-                continue
-
-            stage_start = time.perf_counter()
-            stats = _StageExecutionStats(name=spec.name)
+        if checkpoint:
+            completed_idx = self._stage_index.get(checkpoint.metadata.stage)
+            if completed_idx is not None:
+                start_stage_idx = completed_idx + 1
+
+        # Each stage waits on its dependencies' events and sets its own once it
+        # has completed or been skipped. Checkpoints and progress callbacks go to
+        # background workers so they overlap with the next stage instead of
+        # delaying it.
+        stage_done: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in self._stage_specs}
+        stats_by_stage: Dict[str, _StageExecutionStats] = {}
+        session_token = _SESSION_ID.set(session_id)
+        cancel_event = asyncio.Event()
+        self._cancel_events.add(cancel_event)
+        checkpoint_queue: Optional["asyncio.Queue[_CheckpointJob]"] = None
+        checkpoint_writer: Optional[asyncio.Task] = None
+        if self.checkpoint_manager and self.config.enable_checkpointing:
+            checkpoint_queue = asyncio.Queue()
+            checkpoint_writer = _create_task(self._checkpoint_writer(checkpoint_queue))
+        progress_queue: Optional["asyncio.Queue[Tuple[str, Dict[str, Any]]]"] = None
+        progress_worker: Optional[asyncio.Task] = None
+        emit: Callable[[str, Dict[str, Any]], Awaitable[None]] = _no_progress
+        if context.progress_callback is not None:
+            progress_queue = asyncio.Queue(maxsize=_PROGRESS_QUEUE_SIZE)
+            progress_worker = _create_task(self._progress_worker(progress_queue, context.progress_callback))
+
+            async def emit(stage: str, payload: Dict[str, Any]) -> None:
+                try:
+                    progress_queue.put_nowait((stage, payload))
+                except asyncio.QueueFull:
+                    # The callback has fallen far behind; wait for room rather than grow unbounded
+                    await progress_queue.put((stage, payload))
+
+        # Bound once per run; run_stage reads them on every attempt
+        record_stage_event = functools.partial(self.telemetry_collector.record_stage_event, session_id)
+        stage_metrics = context.stage_metrics
+
+        async def run_stage(spec: _StageSpec) -> None:
+            stage_name = spec.name
+            predicate = spec.predicate
+            executor = spec.executor
+            max_retries = spec.max_retries
+            backoff_base = spec.retry_backoff
+            max_retry_sleep = self.config.max_retry_sleep
+
+            for dependency in spec.depends_on:
+                await stage_done[dependency].wait()
+
+            stage_start = now()
+            stats = _StageExecutionStats(name=stage_name)
+            stats_by_stage[stage_name] = stats
+            # Filled in place once the stage settles; observers may hold on to it
+            stage_entry: Dict[str, Any] = stage_metrics.setdefault(stage_name, {})
 
             # Telemetry: stage started
-            if self.telemetry_collector:
-                self.telemetry_collector.record_stage_event(
-                    session_id=session_id, stage=spec.name, status="started", attempt=1, duration=0.0
-                )
+            record_stage_event(stage=stage_name, status="started", attempt=1, duration=0.0)
 
-            if spec.predicate and not spec.predicate(context):
+            if predicate and not predicate(context):
                 stats.skipped = True
-                stage_stats.append(stats)
-                context.stage_metrics[spec.name] = {"status": "skipped"}
-                await self._emit(f"{spec.name}_skipped", {"reason": "predicate"}, context.progress_callback)
-                if self.telemetry_collector:
-                    self.telemetry_collector.record_stage_event(
-                        session_id=session_id,
-                        stage=spec.name,
-                        status="skipped",
-                        attempt=1,
-                        duration=time.perf_counter() - stage_start,
-                    )
-                continue
+                stage_entry["status"] = "skipped"
+                await emit(spec.event_skipped, {"reason": "predicate"})
+                record_stage_event(
+                    stage=stage_name,
+                    status="skipped",
+                    attempt=1,
+                    duration=now() - stage_start,
+                )
+                stage_done[stage_name].set()
+                return
 
             attempt = 0
-            while attempt < spec.max_retries:
+            while attempt < max_retries:
                 attempt += 1
                 stats.attempts = attempt
-                await self._emit(f"{spec.name}_start", {"attempt": attempt}, context.progress_callback)
-                attempt_start = time.perf_counter()
+                await emit(spec.event_start, {"attempt": attempt})
+                attempt_start = now()
 
                 try:
-                    event_payload, detail_metrics = await spec.executor(context)
-                    attempt_duration = time.perf_counter() - attempt_start
+                    event_payload, detail_metrics = await executor(context)
+                    attempt_duration = now() - attempt_start
                     stats.duration_seconds += attempt_duration
                     stats.success = True
                     stats.details = detail_metrics
-                    context.stage_metrics[spec.name] = {
-                        **detail_metrics,
-                        "attempts": attempt,
-                        "duration_seconds": stats.duration_seconds,
-                        "status": "completed",
-                    }
-                    await self._emit(spec.name, event_payload, context.progress_callback)
+                    stage_entry.update(detail_metrics)
+                    stage_entry["attempts"] = attempt
+                    stage_entry["duration_seconds"] = stats.duration_seconds
+                    stage_entry["status"] = "completed"
+                    await emit(stage_name, event_payload)
 
                     # Telemetry: stage completed
-                    if self.telemetry_collector:
-                        self.telemetry_collector.record_stage_event(
-                            session_id=session_id,
-                            stage=spec.name,
-                            status="completed",
-                            attempt=attempt,
-                            duration=attempt_duration,
-                            details=detail_metrics,
-                        )
+                    record_stage_event(
+                        stage=stage_name,
+                        status="completed",
+                        attempt=attempt,
+                        duration=attempt_duration,
+                        details=detail_metrics,
+                    )
 
-                    # Checkpoint: save after successful stage
-                    if self.checkpoint_manager and self.config.enable_checkpointing:
-                        self._save_checkpoint(session_id, spec.name, context)
+                    # Checkpoint: save after successful stage, off the critical path
+                    if checkpoint_queue is not None:
+                        checkpoint_queue.put_nowait(
+                            (stage_name, context.prompt, self._checkpoint_snapshot(context))
+                        )
 
                     break
                 except Exception as exc:
-                    stats.error = repr(exc)
-                    logger.exception("Stage %s failed on attempt %s", spec.name, attempt)
+                    error = str(exc)
+                    stats.error = error
+                    logger.exception("Stage %s failed on attempt %s", stage_name, attempt)
 
                     # Telemetry: retry or failure
-                    if self.telemetry_collector:
-                        status = "retrying" if attempt < spec.max_retries else "failed"
-                        self.telemetry_collector.record_stage_event(
-                            session_id=session_id,
-                            stage=spec.name,
-                            status=status,
-                            attempt=attempt,
-                            duration=time.perf_counter() - attempt_start,
-                            error=str(exc),
-                        )
-
-                    await self._emit(
-                        f"{spec.name}_retry",
-                        {"attempt": attempt, "error": str(exc)},
-                        context.progress_callback,
+                    record_stage_event(
+                        stage=stage_name,
+                        status="retrying" if attempt < max_retries and not cancel_event.is_set() else "failed",
+                        attempt=attempt,
+                        duration=now() - attempt_start,
+                        error=error,
                     )
-                    if attempt >= spec.max_retries:
+
+                    await emit(spec.event_retry, {"attempt": attempt, "error": error})
+                    if attempt >= max_retries or cancel_event.is_set():
                         raise
-                    backoff = spec.retry_backoff ** attempt
-                    await asyncio.sleep(backoff)
+                    # Capped exponential backoff with jitter, so runs failing on the
+                    # same upstream outage do not all retry in lockstep
+                    backoff = min(backoff_base ** attempt, max_retry_sleep)
+                    backoff = min(backoff + random.uniform(0, backoff / 2), max_retry_sleep)
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(cancel_event.wait(), timeout=backoff)
+                    if cancel_event.is_set():
+                        raise
+
+            stage_done[stage_name].set()
 
-            stage_stats.append(stats)
+        # Agent warm-up overlaps the first stages instead of delaying them
+        prewarm_task = _create_task(self._prewarm_agents())
+        stage_tasks: List[asyncio.Task] = []
+        for idx, (name, spec) in enumerate(self._stage_specs.items()):
+            if idx < start_stage_idx:
+                logger.info("Skipping already completed stage: %s", name)
+                stage_done[name].set()
+                continue
+            stage_tasks.append(_create_task(run_stage(spec)))
 
-        workflow_duration = time.perf_counter() - workflow_start
+        try:
+            if stage_tasks:
+                await asyncio.wait(stage_tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # A failed stage leaves its dependents waiting forever; cancel them
+            for task in stage_tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*stage_tasks, prewarm_task, return_exceptions=True)
+            # Deliver the progress events and checkpoints of completed stages
+            # even when a later stage failed
+            if progress_queue is not None and progress_worker is not None:
+                await progress_queue.join()
+                progress_worker.cancel()
+                await asyncio.gather(progress_worker, return_exceptions=True)
+            if checkpoint_queue is not None and checkpoint_writer is not None:
+                await checkpoint_queue.join()
+                checkpoint_writer.cancel()
+                await asyncio.gather(checkpoint_writer, return_exceptions=True)
+            _SESSION_ID.reset(session_token)
+            self._cancel_events.discard(cancel_event)
+
+        for task in stage_tasks:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+        stage_stats = [stats_by_stage[name] for name in self._stage_specs if name in stats_by_stage]
+
+        workflow_duration = now() - workflow_start
         if context.turnitin is None or context.draft is None or context.evaluation is None:
             raise RuntimeError("Pipeline did not complete successfully; final artifacts missing.")
 
@@ -312,8 +514,7 @@ class ProwziOrchestrator:
         draft_result = context.draft
         evaluation_result = context.evaluation
 
-        stage_summary: Dict[str, Dict[str, Any]] = {stat.name: asdict(stat) for stat in stage_stats}
-        post_eval_stats: Dict[str, Any] = stage_summary.get("post_turnitin_evaluation", {"skipped": True})
+        post_eval_stats = stats_by_stage.get("post_turnitin_evaluation")
 
         initial_evaluation = context.initial_evaluation
 
@@ -321,23 +522,34 @@ class ProwziOrchestrator:
             "workflow_duration_seconds": workflow_duration,
             "turnitin_attempts": len(turnitin_result.iterations),
             "turnitin_success": turnitin_result.success,
-            "re_evaluated": not post_eval_stats.get("skipped", True),
+            "re_evaluated": post_eval_stats is not None and not post_eval_stats.skipped,
             "initial_evaluation_score": initial_evaluation.total_score if initial_evaluation else None,
             "final_evaluation_score": evaluation_result.total_score,
             "evaluation_delta": (evaluation_result.total_score - initial_evaluation.total_score) if initial_evaluation else None,
-            "stage_metrics": stage_summary,
+            # Shallow: details stays the same dict already referenced by the stage metrics
+            "stage_metrics": {
+                stat.name: {
+                    "name": stat.name,
+                    "attempts": stat.attempts,
+                    "duration_seconds": stat.duration_seconds,
+                    "success": stat.success,
+                    "skipped": stat.skipped,
+                    "error": stat.error,
+                    "details": stat.details,
+                }
+                for stat in stage_stats
+            },
             "stage_details": context.stage_metrics,
             "session_id": session_id,
         }
 
         # Complete telemetry session
-        if self.telemetry_collector:
-            self.telemetry_collector.complete_session(
-                session_id=session_id,
-                success=True,
-                total_duration=workflow_duration,
-                final_metadata=metadata,
-            )
+        self.telemetry_collector.complete_session(
+            session_id=session_id,
+            success=True,
+            total_duration=workflow_duration,
+            final_metadata=metadata,
+        )
 
         return ProwziOrchestrationResult(
             intent=context.intent,
@@ -429,14 +641,13 @@ class ProwziOrchestrator:
             max_sections=context.max_sections,
         )
         context.draft = draft
-        return {
+        event_payload = {
             "sections": len(draft.sections),
             "word_count": draft.total_word_count,
-        }, {
-            "sections": len(draft.sections),
-            "word_count": draft.total_word_count,
-            "bibliography_entries": len(draft.bibliography),
         }
+        detail_metrics = dict(event_payload)
+        detail_metrics["bibliography_entries"] = len(draft.bibliography)
+        return event_payload, detail_metrics
 
     async def _stage_evaluation(self, context: _StageContext) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         if context.intent is None or context.plan is None or context.verification is None or context.draft is None:
@@ -449,6 +660,7 @@ class ProwziOrchestrator:
         )
         context.evaluation = evaluation
         context.initial_evaluation = evaluation
+        context.evaluated_draft = context.draft
         return {
             "score": evaluation.total_score,
             "pass_threshold": evaluation.pass_threshold,
@@ -471,29 +683,32 @@ class ProwziOrchestrator:
         )
         context.turnitin = turnitin
         context.draft = turnitin.final_document
-        return {
-            "success": turnitin.success,
-            "attempts": len(turnitin.iterations),
-            "similarity": turnitin.final_report.similarity_score,
-            "ai_detection": turnitin.final_report.ai_detection_score,
-        }, {
+        event_payload = {
             "success": turnitin.success,
             "attempts": len(turnitin.iterations),
             "similarity": turnitin.final_report.similarity_score,
             "ai_detection": turnitin.final_report.ai_detection_score,
         }
+        # Separate copies: the progress callback may keep or modify its payload
+        return event_payload, dict(event_payload)
 
     async def _stage_post_turnitin_evaluation(
         self, context: _StageContext
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         if context.intent is None or context.plan is None or context.verification is None or context.draft is None:
             raise RuntimeError("Turnitin stage must complete before post evaluation.")
-        evaluation = await self.evaluation_agent.evaluate_draft(
-            intent=context.intent,
-            plan=context.plan,
-            verification=context.verification,
-            draft=context.draft,
-        )
+        # A redraft that left the document unchanged would be scored the same;
+        # reuse the initial evaluation rather than paying for another LLM call.
+        if context.initial_evaluation is not None and self._draft_unchanged(context):
+            logger.info("Draft unchanged after Turnitin redrafts; reusing initial evaluation")
+            evaluation = context.initial_evaluation
+        else:
+            evaluation = await self.evaluation_agent.evaluate_draft(
+                intent=context.intent,
+                plan=context.plan,
+                verification=context.verification,
+                draft=context.draft,
+            )
         previous_score = context.initial_evaluation.total_score if context.initial_evaluation else None
         context.evaluation = evaluation
         return {
@@ -504,8 +719,24 @@ class ProwziOrchestrator:
             "score": evaluation.total_score,
             "delta": (evaluation.total_score - previous_score) if previous_score is not None else None,
             "risk_count": len(evaluation.risks),
+            "reused_initial": evaluation is context.initial_evaluation,
         }
 
+    @staticmethod
+    def _draft_unchanged(context: _StageContext) -> bool:
+        """Whether the current draft matches the one the initial evaluation scored.
+
+        Intent, plan and verification are the same objects that evaluation
+        saw, so only the draft is compared.
+        """
+        evaluated_draft = context.evaluated_draft
+        if evaluated_draft is None or context.draft is None:
+            return False
+        if context.draft is evaluated_draft:
+            return True
+        fingerprint = _draft_fingerprint(context.draft)
+        return fingerprint is not None and fingerprint == _draft_fingerprint(evaluated_draft)
+
     def _should_run_post_turnitin_evaluation(self, context: _StageContext) -> bool:
         if context.turnitin is None:
             return False
@@ -524,40 +755,104 @@ class ProwziOrchestrator:
         except Exception as exc:
             logger.warning("Progress callback for stage '%s' failed: %s", stage, exc)
 
-    def _save_checkpoint(self, session_id: str, stage_name: str, context: _StageContext) -> None:
-        """Save workflow checkpoint after successful stage completion."""
+    async def _prewarm_agents(self) -> None:
+        """Run the optional ``prewarm`` hook of every downstream agent concurrently."""
+        agents = (
+            self.planning_agent,
+            self.search_agent,
+            self.verification_agent,
+            self.writing_agent,
+            self.evaluation_agent,
+            self.turnitin_agent,
+        )
+        hooks = [agent.prewarm for agent in agents if hasattr(agent, "prewarm")]
+        results = await asyncio.gather(*(hook() for hook in hooks), return_exceptions=True)
+        for hook, result in zip(hooks, results):
+            if isinstance(result, Exception):
+                logger.warning("Prewarm of %s failed: %s", type(hook.__self__).__name__, result)
+
+    async def _progress_worker(
+        self,
+        queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]",
+        callback: ProgressCallback,
+    ) -> None:
+        """Deliver queued progress events to the callback one at a time, in order."""
+        while True:
+            stage, payload = await queue.get()
+            try:
+                await self._emit(stage, payload, callback)
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def _checkpoint_snapshot(context: _StageContext) -> Dict[str, Any]:
+        """Capture the checkpointed context fields as of now.
+
+        Agent results are not mutated once stored, so they are shared. Each
+        stage's metrics dict is copied, since stages update theirs in place
+        while the writer thread encodes the snapshot.
+        """
+        snapshot = {name: getattr(context, name) for name in _CHECKPOINT_FIELDS}
+        snapshot["stage_metrics"] = {stage: dict(metrics) for stage, metrics in context.stage_metrics.items()}
+        return snapshot
+
+    async def _checkpoint_writer(self, queue: "asyncio.Queue[_CheckpointJob]") -> None:
+        """Persist queued checkpoints in a worker thread, one batch at a time.
+
+        The queue belongs to a single run. Everything queued while the previous
+        batch was being written is combined: only the newest snapshot is saved,
+        since it supersedes the earlier stages' checkpoints for resume purposes.
+        Each save carries just the agent results that changed since the last
+        successful one.
+        """
+        # Agent results as of the last successful save
+        persisted: Dict[str, Any] = {}
+        while True:
+            jobs = [await queue.get()]
+            while not queue.empty():
+                jobs.append(queue.get_nowait())
+
+            stage_name, prompt, snapshot = jobs[-1]
+            try:
+                # Results are replaced rather than mutated, so identity marks a change
+                delta = {
+                    name: snapshot[name] for name in _CHECKPOINT_FIELDS if snapshot[name] is not persisted.get(name)
+                }
+                saved = await asyncio.to_thread(
+                    self._write_checkpoint, stage_name, prompt, delta, snapshot["stage_metrics"]
+                )
+                if saved:
+                    persisted.update(delta)
+            finally:
+                for _ in jobs:
+                    queue.task_done()
+
+    def _write_checkpoint(
+        self,
+        stage_name: str,
+        prompt: str,
+        fields: Dict[str, Any],
+        stage_metrics: Dict[str, Any],
+    ) -> bool:
+        """Persist a checkpoint delta for the current session; safe to run in a worker thread."""
         if not self.checkpoint_manager:
-            return
+            return False
 
+        session_id = _SESSION_ID.get()
         try:
-            context_dict = {
-                "intent": context.intent,
-                "plan": context.plan,
-                "search": context.search,
-                "verification": context.verification,
-                "draft": context.draft,
-                "evaluation": context.evaluation,
-                "initial_evaluation": context.initial_evaluation,
-                "turnitin": context.turnitin,
-                "stage_metrics": context.stage_metrics,
-                "document_paths": [str(p) for p in context.document_paths] if context.document_paths else None,
-                "additional_context": context.additional_context,
-                "custom_constraints": context.custom_constraints,
-                "max_results_per_query": context.max_results_per_query,
-                "max_sections": context.max_sections,
-                "thresholds": context.thresholds,
-            }
-
-            self.checkpoint_manager.save_checkpoint(
+            checkpoint_id = self.checkpoint_manager.save_delta(
                 session_id=session_id,
                 stage=stage_name,
-                prompt=context.prompt,
-                context=context_dict,
-                stage_metrics=context.stage_metrics,
+                prompt=prompt,
+                new_fields=fields,
+                stage_metrics=stage_metrics,
             )
-            logger.info("Checkpoint saved for session %s at stage %s", session_id, stage_name)
         except Exception as exc:
             logger.warning("Failed to save checkpoint: %s", exc)
+            return False
+        if checkpoint_id:
+            logger.info("Checkpoint saved for session %s at stage %s", session_id, stage_name)
+        return bool(checkpoint_id)
 
     def _restore_context_from_checkpoint(
         self,
@@ -593,6 +888,76 @@ class ProwziOrchestrator:
             stage_metrics=checkpoint.stage_metrics,
         )
 
+    def cancel(self) -> None:
+        """Stop in-flight runs from retrying failed stages.
+
+        A stage waiting out its retry backoff wakes immediately and fails with
+        the error it was about to retry. Runs started afterwards are unaffected.
+        Call from the thread running the event loop.
+        """
+        for event in self._cancel_events:
+            event.set()
+
+    async def aclose(self) -> None:
+        """Flush telemetry and close the running event loop's shared HTTP session.
+
+        Runs never close the session themselves, since other orchestrators and
+        search callers on the loop share it; call this from the code that owns
+        the loop once they are done. Later runs reopen both on demand.
+        """
+        self.telemetry_collector.close()
+        await close_session()
+
+    async def resume_batch(
+        self,
+        checkpoint_ids: List[str],
+        concurrency: int = 8,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, ProwziOrchestrationResult | Exception]:
+        """Resume several checkpoints with up to ``concurrency`` workflows in flight.
+
+        A new resume starts as soon as any running one finishes, so a single slow
+        workflow never holds back the rest of the batch. A failed resume is
+        reported as its exception instead of aborting the others.
+
+        Returns:
+            Mapping of checkpoint ID to its result or exception, in input order
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        ordered_ids = list(dict.fromkeys(checkpoint_ids))
+        queued = iter(ordered_ids)
+        outcomes: Dict[str, ProwziOrchestrationResult | Exception] = {}
+        pending: Dict[asyncio.Task, str] = {}
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    checkpoint_id = next(queued, None)
+                    if checkpoint_id is None:
+                        break
+                    task = _create_task(self.resume_from_checkpoint(checkpoint_id, progress_callback))
+                    pending[task] = checkpoint_id
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    checkpoint_id = pending.pop(task)
+                    exc = task.exception()
+                    if exc is not None:
+                        logger.warning("Resuming checkpoint %s failed: %s", checkpoint_id, exc)
+                        outcomes[checkpoint_id] = exc
+                    else:
+                        outcomes[checkpoint_id] = task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return {checkpoint_id: outcomes[checkpoint_id] for checkpoint_id in ordered_ids}
+
     async def resume_from_checkpoint(
         self,
         checkpoint_id: str,
@@ -608,9 +973,9 @@ class ProwziOrchestrator:
 
         logger.info("Resuming workflow from checkpoint: %s (stage: %s)", checkpoint_id, checkpoint.metadata.stage)
 
-        # Resume workflow with checkpoint ID to restore state
+        # Resume workflow from the loaded checkpoint to restore state
         return await self.run_research(
             prompt=checkpoint.metadata.prompt,
             progress_callback=progress_callback,
-            checkpoint_id=checkpoint_id,
+            _checkpoint=checkpoint,
         )
@@ -2,17 +2,113 @@
 
 from __future__ import annotations
 
+import atexit
+import dataclasses
 import json
 import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
+from prowzi.workflows._serialization import json_default, load_json, write_atomic
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Weakly held so the exit hook does not keep discarded collectors alive
+_LIVE_COLLECTORS: "weakref.WeakSet[TelemetryCollector]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_collectors() -> None:
+    """Write records still queued by any collector when the interpreter exits."""
+    for collector in list(_LIVE_COLLECTORS):
+        collector.flush()
+
+
+def _dump_json_line(record: Any) -> bytes:
+    """Encode one compact, newline-terminated JSONL record."""
+    if orjson is not None:
+        return orjson.dumps(record, default=json_default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, default=json_default, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+# Session logs are streams of msgpack records when available, JSON lines otherwise
+_LOG_MSGPACK_SUFFIX = ".msgpack"
+_LOG_JSON_SUFFIX = ".jsonl"
+# Lookup order for a session's file; ".json" is the legacy single document
+_SESSION_SUFFIXES = (_LOG_MSGPACK_SUFFIX, _LOG_JSON_SUFFIX, ".json")
+
+
+def _dump_log_record(record: Any) -> bytes:
+    """Encode one session-log record so it can be appended to the log as-is."""
+    if msgpack is not None:
+        return msgpack.packb(record, default=json_default, use_bin_type=True)
+    return _dump_json_line(record)
+
+
+def _iter_log_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a session log in the order they were appended."""
+    if path.suffix == _LOG_MSGPACK_SUFFIX:
+        # msgpack records are self-delimiting, so the log is plain concatenation
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(path.read_bytes())
+        yield from unpacker
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield load_json(line)
+
+
+def _iter_lines_reversed(path: Path, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a file's non-empty lines last to first, reading backwards in chunks."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may continue in the previous chunk
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+
+@dataclass(slots=True)
 class StageMetrics:
     """Metrics for a single stage execution."""
 
@@ -20,12 +116,23 @@ class StageMetrics:
     status: str  # started, completed, failed, skipped, retrying
     attempt: int
     duration_seconds: float
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() when recorded
     details: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # A handful of stage names and statuses repeat across every event;
+        # share one string each, including for events decoded from disk
+        self.stage = sys.intern(self.stage)
+        self.status = sys.intern(self.status)
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the event was recorded, as an aware UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Aggregated metrics for entire workflow execution."""
 
@@ -34,21 +141,77 @@ class WorkflowMetrics:
     started_at: datetime
     completed_at: Optional[datetime] = None
     total_duration_seconds: float = 0.0
-    stages: List[StageMetrics] = field(default_factory=list)
+    # Most recent events only when the collector caps stage history
+    stages: Deque[StageMetrics] = field(default_factory=deque)
     total_retries: int = 0
+    stages_completed: int = 0
     failed_stages: List[str] = field(default_factory=list)
     success: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Membership index over failed_stages, which keeps the order; not persisted
+    failed_stage_set: Set[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.failed_stage_set = set(self.failed_stages)
 
-class TelemetryCollector:
-    """Collects and persists workflow telemetry data."""
 
-    def __init__(self, output_dir: Path, enabled: bool = True) -> None:
+class TelemetryCollector:
+    """Collects and persists workflow telemetry data.
+
+    Each session is an append-only ``telemetry_<id>.msgpack`` log (JSON lines
+    in ``telemetry_<id>.jsonl`` without msgpack): a ``start`` record, one
+    ``stage`` record per event, and a ``complete`` record. Sessions persisted
+    as a single ``telemetry_<id>.json`` document by older versions are still
+    read, and ``export_json`` writes any session as readable JSON.
+
+    Records are encoded when recorded but written by a background thread,
+    once ``batch_size`` are queued or every ``flush_interval_ms``, with one
+    write per session per batch. The thread starts with the first queued
+    record and exits after an interval with nothing to write. Completing a
+    session, reading sessions back and interpreter exit all flush first.
+
+    ``index.jsonl`` gets a summary line whenever a session starts, retries or
+    fails a stage, or completes, so listing recent sessions reads only the
+    end of one file.
+
+    In memory, a session keeps only its last ``max_stage_history`` stage
+    events; older ones are already in the log, and ``load_session(full=True)``
+    reads the whole history back.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        enabled: bool = True,
+        batch_size: int = 64,
+        flush_interval_ms: int = 250,
+        pretty: bool = False,
+        max_stage_history: int = 1000,
+    ) -> None:
         self.output_dir = output_dir
         self.enabled = enabled
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        # Also export each completed session as indented JSON for manual inspection
+        self.pretty = pretty
+        self.max_stage_history = max_stage_history
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.active_sessions: Dict[str, WorkflowMetrics] = {}
+        self._log_suffix = _LOG_MSGPACK_SUFFIX if msgpack is not None else _LOG_JSON_SUFFIX
+        self._index_path = self.output_dir / "index.jsonl"
+        if self.enabled and not self._index_path.exists():
+            self._rebuild_index()
+
+        # (file name, encoded line) awaiting the flush thread
+        self._pending: Deque[Tuple[str, bytes]] = deque()
+        self._cond = threading.Condition()
+        # Held across drain and write so batches reach each log in order
+        self._write_lock = threading.Lock()
+        self._closed = False
+        # Started by _enqueue and cleared by the thread itself once idle
+        self._flusher: Optional[threading.Thread] = None
+        if self.enabled:
+            _LIVE_COLLECTORS.add(self)
 
     def start_session(self, session_id: str, prompt: str) -> None:
         """Start tracking a new workflow session."""
@@ -59,8 +222,20 @@ class TelemetryCollector:
             session_id=session_id,
             prompt=prompt[:500],
             started_at=datetime.now(timezone.utc),
+            stages=deque(maxlen=self.max_stage_history),
         )
         self.active_sessions[session_id] = metrics
+        self._append_record(
+            session_id,
+            {
+                "type": "start",
+                "session_id": session_id,
+                "prompt": metrics.prompt,
+                "started_at": metrics.started_at,
+            },
+        )
+        # Listed from the start, since the orchestrator never completes failed sessions
+        self._enqueue(self._index_path.name, self._index_entry(metrics))
         logger.debug("Telemetry session started: %s", session_id)
 
     def record_stage_event(
@@ -87,20 +262,16 @@ class TelemetryCollector:
             status=status,
             attempt=attempt,
             duration_seconds=duration,
-            timestamp=datetime.now(timezone.utc),
+            timestamp_ns=time.time_ns(),
             details=details or {},
             error=error,
         )
 
-        metrics.stages.append(stage_metric)
-
-        if status == "retrying":
-            metrics.total_retries += 1
-        elif status == "failed":
-            if stage not in metrics.failed_stages:
-                metrics.failed_stages.append(stage)
-
-        self._persist_session(session_id)
+        self._apply_stage_event(metrics, stage_metric)
+        self._append_record(session_id, {"type": "stage", "stage": stage_metric})
+        if status in ("retrying", "failed"):
+            # Failed sessions are never completed; keep their index summary current
+            self._enqueue(self._index_path.name, self._index_entry(metrics))
 
     def complete_session(
         self,
@@ -124,7 +295,20 @@ class TelemetryCollector:
         if final_metadata:
             metrics.metadata.update(final_metadata)
 
-        self._persist_session(session_id)
+        self._append_record(
+            session_id,
+            {
+                "type": "complete",
+                "completed_at": metrics.completed_at,
+                "total_duration_seconds": total_duration,
+                "success": success,
+                "metadata": metrics.metadata,
+            },
+        )
+        self._enqueue(self._index_path.name, self._index_entry(metrics))
+        self.flush()
+        if self.pretty:
+            self.export_json(session_id)
         logger.info(
             "Telemetry session completed: %s (success: %s, retries: %d)",
             session_id,
@@ -136,85 +320,239 @@ class TelemetryCollector:
         """Retrieve metrics for a session."""
         return self.active_sessions.get(session_id)
 
-    def _persist_session(self, session_id: str) -> None:
-        """Persist session metrics to disk."""
-        metrics = self.active_sessions.get(session_id)
-        if not metrics:
-            return
+    @staticmethod
+    def _apply_stage_event(metrics: WorkflowMetrics, stage_metric: StageMetrics) -> None:
+        """Add a stage event to the session and update its tallies.
 
-        try:
-            telemetry_path = self.output_dir / f"telemetry_{session_id}.json"
-            data = {
-                "session_id": metrics.session_id,
-                "prompt": metrics.prompt,
-                "started_at": metrics.started_at.isoformat(),
-                "completed_at": metrics.completed_at.isoformat() if metrics.completed_at else None,
-                "total_duration_seconds": metrics.total_duration_seconds,
-                "total_retries": metrics.total_retries,
-                "failed_stages": metrics.failed_stages,
-                "success": metrics.success,
-                "metadata": metrics.metadata,
-                "stages": [
-                    {
-                        "stage": s.stage,
-                        "status": s.status,
-                        "attempt": s.attempt,
-                        "duration_seconds": s.duration_seconds,
-                        "timestamp": s.timestamp.isoformat(),
-                        "details": s.details,
-                        "error": s.error,
-                    }
-                    for s in metrics.stages
-                ],
-            }
-
-            with open(telemetry_path, "w") as f:
-                json.dump(data, f, indent=2)
+        Tallies cover every event, including those the stage window has dropped.
+        """
+        metrics.stages.append(stage_metric)
 
+        if stage_metric.status == "completed":
+            metrics.stages_completed += 1
+        elif stage_metric.status == "retrying":
+            metrics.total_retries += 1
+        elif stage_metric.status == "failed":
+            if stage_metric.stage not in metrics.failed_stage_set:
+                metrics.failed_stage_set.add(stage_metric.stage)
+                metrics.failed_stages.append(stage_metric.stage)
+
+    def flush(self) -> None:
+        """Write every queued record to its session log before returning."""
+        with self._write_lock:
+            with self._cond:
+                batch = list(self._pending)
+                self._pending.clear()
+            if batch:
+                self._write_batch(batch)
+
+    def close(self) -> None:
+        """Flush queued records and stop the background flush thread.
+
+        Records queued afterwards start a new thread.
+        """
+        with self._cond:
+            self._closed = True
+            flusher = self._flusher
+            self._cond.notify()
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+        with self._cond:
+            self._closed = False
+
+    def _append_record(self, session_id: str, record: Dict[str, Any]) -> None:
+        """Queue one record for the session's log; earlier records are never rewritten."""
+        self._enqueue(f"telemetry_{session_id}{self._log_suffix}", record, _dump_log_record)
+
+    def _enqueue(
+        self,
+        file_name: str,
+        record: Dict[str, Any],
+        encode: Callable[[Any], bytes] = _dump_json_line,
+    ) -> None:
+        """Queue one record to be appended to a file in the output directory.
+
+        The record is encoded now, so later changes to the objects it references
+        do not leak into the file.
+        """
+        try:
+            line = encode(record)
         except Exception as exc:
-            logger.warning("Failed to persist telemetry for session %s: %s", session_id, exc)
+            logger.warning("Failed to encode telemetry record for %s: %s", file_name, exc)
+            return
+        with self._cond:
+            self._pending.append((file_name, line))
+            if self._flusher is None and not self._closed:
+                self._flusher = threading.Thread(target=self._flush_loop, name="telemetry-flush", daemon=True)
+                self._flusher.start()
+            elif len(self._pending) >= self.batch_size:
+                self._cond.notify()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                if self._closed or not self._pending:
+                    # close() flushes whatever is left; the next record restarts the thread
+                    self._flusher = None
+                    return
+            self.flush()
+
+    def _write_batch(self, batch: List[Tuple[str, bytes]]) -> None:
+        """Append a batch of records with one write per file.
+
+        Files are opened per batch rather than held open, since sessions that
+        fail are never completed and would otherwise leak their handle. Where
+        available, an exclusive lock keeps other processes' appends to the
+        shared index from interleaving with ours.
+        """
+        lines_by_file: Dict[str, List[bytes]] = {}
+        for file_name, line in batch:
+            lines_by_file.setdefault(file_name, []).append(line)
+        for file_name, lines in lines_by_file.items():
+            try:
+                with open(self.output_dir / file_name, "ab") as f:
+                    if fcntl is not None:
+                        fcntl.flock(f, fcntl.LOCK_EX)
+                    f.write(b"".join(lines))
+            except Exception as exc:
+                logger.warning("Failed to persist telemetry to %s: %s", file_name, exc)
+
+    @staticmethod
+    def _index_entry(metrics: WorkflowMetrics) -> Dict[str, Any]:
+        """Summary of a session as listed by list_sessions."""
+        return {
+            "session_id": metrics.session_id,
+            "prompt": metrics.prompt[:100],
+            "started_at": metrics.started_at.isoformat(),
+            "success": metrics.success,
+            "total_retries": metrics.total_retries,
+            "stages_completed": metrics.stages_completed,
+        }
+
+    def _session_files(self) -> List[Path]:
+        """Session files in the output directory, least recently modified first."""
+        # DirEntry caches stat(), so each file costs one syscall for both the filter and the sort
+        with os.scandir(self.output_dir) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.startswith("telemetry_") and entry.name.endswith(_SESSION_SUFFIXES) and entry.is_file()
+            ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        return [Path(entry.path) for entry in entries]
 
-    def load_session(self, session_id: str) -> Optional[WorkflowMetrics]:
-        """Load persisted session metrics."""
+    def _rebuild_index(self) -> None:
+        """Write index.jsonl from the session files on disk, oldest first."""
+        lines: List[bytes] = []
+        for telemetry_file in self._session_files():
+            try:
+                metrics = self._read_session(telemetry_file, self.max_stage_history)
+                lines.append(_dump_json_line(self._index_entry(metrics)))
+            except Exception as exc:
+                logger.warning("Failed to read telemetry file %s: %s", telemetry_file, exc)
+        write_atomic(self._index_path, b"".join(lines))
+
+    def _session_path(self, session_id: str) -> Optional[Path]:
+        """Return the session's log, or its legacy single-document file."""
+        for suffix in _SESSION_SUFFIXES:
+            path = self.output_dir / f"telemetry_{session_id}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    @classmethod
+    def _read_session(cls, path: Path, max_stages: Optional[int] = None) -> WorkflowMetrics:
+        """Rebuild a session's metrics from its log or legacy document.
+
+        Only the last ``max_stages`` stage events are kept, if given.
+        """
+        if path.suffix == ".json":
+            return cls._session_from_document(load_json(path.read_bytes()), max_stages)
+
+        metrics: Optional[WorkflowMetrics] = None
+        for record in _iter_log_records(path):
+            kind = record.get("type")
+            if kind == "start":
+                metrics = WorkflowMetrics(
+                    session_id=record["session_id"],
+                    prompt=record["prompt"],
+                    started_at=datetime.fromisoformat(record["started_at"]),
+                    stages=deque(maxlen=max_stages),
+                )
+            elif metrics is None:
+                raise ValueError(f"Telemetry log {path.name} does not begin with a start record")
+            elif kind == "stage":
+                cls._apply_stage_event(metrics, cls._stage_from_dict(record["stage"]))
+            elif kind == "complete":
+                metrics.completed_at = datetime.fromisoformat(record["completed_at"])
+                metrics.total_duration_seconds = record["total_duration_seconds"]
+                metrics.success = record["success"]
+                metrics.metadata = record.get("metadata", {})
+        if metrics is None:
+            raise ValueError(f"Telemetry log {path.name} is empty")
+        return metrics
+
+    @staticmethod
+    def _stage_from_dict(s: Dict[str, Any]) -> StageMetrics:
+        if "timestamp_ns" not in s:
+            # Recorded as an ISO datetime by older versions
+            s = dict(s)
+            elapsed = datetime.fromisoformat(s.pop("timestamp")) - _EPOCH
+            s["timestamp_ns"] = elapsed // timedelta(microseconds=1) * 1000
+        if msgspec is not None:
+            return msgspec.convert(s, StageMetrics)
+        return StageMetrics(
+            stage=s["stage"],
+            status=s["status"],
+            attempt=s["attempt"],
+            duration_seconds=s["duration_seconds"],
+            timestamp_ns=s["timestamp_ns"],
+            details=s.get("details", {}),
+            error=s.get("error"),
+        )
+
+    @classmethod
+    def _session_from_document(cls, data: Dict[str, Any], max_stages: Optional[int] = None) -> WorkflowMetrics:
+        stages = [cls._stage_from_dict(s) for s in data.get("stages", [])]
+        return WorkflowMetrics(
+            session_id=data["session_id"],
+            prompt=data["prompt"],
+            started_at=datetime.fromisoformat(data["started_at"]),
+            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            total_duration_seconds=data["total_duration_seconds"],
+            stages=deque(stages, maxlen=max_stages),
+            total_retries=data["total_retries"],
+            stages_completed=sum(1 for s in stages if s.status == "completed"),
+            failed_stages=data["failed_stages"],
+            success=data["success"],
+            metadata=data.get("metadata", {}),
+        )
+
+    def load_session(self, session_id: str, full: bool = False) -> Optional[WorkflowMetrics]:
+        """Load persisted session metrics.
+
+        The session is capped to the collector's stage window and becomes the
+        active copy; with ``full=True`` every stage event is read and the
+        result is returned without replacing the active copy.
+        """
         if not self.enabled:
             return None
 
+        self.flush()
         try:
-            telemetry_path = self.output_dir / f"telemetry_{session_id}.json"
-            if not telemetry_path.exists():
+            telemetry_path = self._session_path(session_id)
+            if telemetry_path is None:
                 return None
 
-            with open(telemetry_path) as f:
-                data = json.load(f)
-
-            stages = [
-                StageMetrics(
-                    stage=s["stage"],
-                    status=s["status"],
-                    attempt=s["attempt"],
-                    duration_seconds=s["duration_seconds"],
-                    timestamp=datetime.fromisoformat(s["timestamp"]),
-                    details=s.get("details", {}),
-                    error=s.get("error"),
-                )
-                for s in data.get("stages", [])
-            ]
-
-            metrics = WorkflowMetrics(
-                session_id=data["session_id"],
-                prompt=data["prompt"],
-                started_at=datetime.fromisoformat(data["started_at"]),
-                completed_at=datetime.fromisoformat(data["completed_at"])
-                if data.get("completed_at")
-                else None,
-                total_duration_seconds=data["total_duration_seconds"],
-                stages=stages,
-                total_retries=data["total_retries"],
-                failed_stages=data["failed_stages"],
-                success=data["success"],
-                metadata=data.get("metadata", {}),
-            )
+            if full:
+                return self._read_session(telemetry_path)
 
+            metrics = self._read_session(telemetry_path, self.max_stage_history)
             self.active_sessions[session_id] = metrics
             return metrics
 
@@ -222,29 +560,41 @@ class TelemetryCollector:
             logger.exception("Failed to load telemetry for session %s: %s", session_id, exc)
             return None
 
+    def export_json(self, session_id: str, path: Optional[Path] = None) -> Optional[Path]:
+        """Write a session as one indented JSON document for manual inspection.
+
+        Defaults to ``export_<id>.json`` in the output directory; returns the
+        path written, or None if the session cannot be loaded.
+        """
+        metrics = self.load_session(session_id, full=True)
+        if metrics is None:
+            return None
+        document = dataclasses.asdict(metrics)
+        del document["failed_stage_set"]
+        export_path = path or self.output_dir / f"export_{session_id}.json"
+        write_atomic(export_path, json.dumps(document, default=json_default, indent=2).encode("utf-8"))
+        return export_path
+
     def list_sessions(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """List recent workflow sessions."""
-        sessions: List[Dict[str, Any]] = []
+        """List recent workflow sessions, most recently started or completed first."""
+        self.flush()
+        if not self._index_path.exists():
+            self._rebuild_index()
 
-        for telemetry_file in sorted(
-            self.output_dir.glob("telemetry_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )[:limit]:
+        sessions: List[Dict[str, Any]] = []
+        seen: set = set()
+        # A session has a line for its start and another once completed; the last wins
+        for line in _iter_lines_reversed(self._index_path):
+            if len(sessions) >= limit:
+                break
             try:
-                with open(telemetry_file) as f:
-                    data = json.load(f)
-                sessions.append(
-                    {
-                        "session_id": data["session_id"],
-                        "prompt": data["prompt"][:100],
-                        "started_at": data["started_at"],
-                        "success": data["success"],
-                        "total_retries": data["total_retries"],
-                        "stages_completed": len([s for s in data.get("stages", []) if s["status"] == "completed"]),
-                    }
-                )
+                entry = load_json(line)
             except Exception as exc:
-                logger.warning("Failed to read telemetry file %s: %s", telemetry_file, exc)
+                logger.warning("Skipping unreadable telemetry index line: %s", exc)
+                continue
+            if entry["session_id"] in seen:
+                continue
+            seen.add(entry["session_id"])
+            sessions.append(entry)
 
         return sessions
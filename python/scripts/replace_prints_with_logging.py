@@ -11,13 +11,20 @@ Usage:
     python scripts/replace_prints_with_logging.py
 """
 
+import ast
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
 # Files to process
 PROWZI_ROOT = Path(__file__).parent.parent / "prowzi"
 
+# Files at least this large are searched through mmap before being read
+MMAP_THRESHOLD = 1024 * 1024
+
 # Patterns to detect log level from context
 ERROR_PATTERNS = [
     r"error",
@@ -45,21 +52,26 @@ DEBUG_PATTERNS = [
     r"verbose",
 ]
 
+# Each list as one precompiled alternation, so a category is a single scan
+_ERROR_RE = re.compile("|".join(ERROR_PATTERNS), re.IGNORECASE)
+_WARNING_RE = re.compile("|".join(WARNING_PATTERNS), re.IGNORECASE)
+_DEBUG_RE = re.compile("|".join(DEBUG_PATTERNS), re.IGNORECASE)
+
 
 def determine_log_level(print_content: str, surrounding_code: str) -> str:
     """Determine appropriate log level based on context."""
-    combined = (print_content + " " + surrounding_code).lower()
+    combined = print_content + " " + surrounding_code
 
     # Check for error patterns
-    if any(re.search(pattern, combined) for pattern in ERROR_PATTERNS):
+    if _ERROR_RE.search(combined):
         return "error"
 
     # Check for warning patterns
-    if any(re.search(pattern, combined) for pattern in WARNING_PATTERNS):
+    if _WARNING_RE.search(combined):
         return "warning"
 
     # Check for debug patterns
-    if any(re.search(pattern, combined) for pattern in DEBUG_PATTERNS):
+    if _DEBUG_RE.search(combined):
         return "debug"
 
     # Default to info
@@ -109,75 +121,98 @@ def add_logger_import(content: str, module_name: str) -> str:
     return "\n".join(lines)
 
 
-def convert_print_to_logger(match: re.Match, surrounding_code: str) -> str:
-    """Convert a print() statement to logger call."""
-    print_content = match.group(1)
-
-    # Determine log level
-    log_level = determine_log_level(print_content, surrounding_code)
-
-    # Handle f-strings
-    if print_content.strip().startswith('f"') or print_content.strip().startswith("f'"):
-        # Already an f-string, just replace print with logger
-        return f"logger.{log_level}({print_content})"
-
-    # Handle format strings
-    if ".format(" in print_content:
-        # Convert to f-string if simple, otherwise keep as-is
-        return f"logger.{log_level}({print_content})"
+def find_print_calls(tree: ast.AST) -> List[ast.Call]:
+    """
+    Find print() calls that map directly onto a logger call.
 
-    # Simple strings
-    return f"logger.{log_level}({print_content})"
+    Only calls with a single positional argument are returned; ``sep``,
+    ``end`` and ``file`` have no logging equivalent, and extra positional
+    arguments would be taken as %-format arguments by the logger.
+    """
+    return [
+        node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "print"
+        and len(node.args) == 1
+        and not isinstance(node.args[0], ast.Starred)
+        and not node.keywords
+    ]
 
 
 def process_file(file_path: Path) -> Tuple[int, List[str]]:
     """
     Process a single Python file to replace print statements.
 
+    The file is parsed once and each print() call is located through the AST,
+    so prints spanning several lines or containing nested parentheses are
+    handled; only the ``print`` name is rewritten and the arguments are kept
+    verbatim.
+
     Returns:
         Tuple of (count of replacements, list of changes made)
     """
     if not file_path.exists():
         return 0, []
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        original_content = f.read()
+    # Most files have no prints; rule them out on raw bytes before decoding or parsing
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"print(") == -1:
+                    return 0, []
+                raw = mm[:]
+        else:
+            raw = f.read()
+            if b"print(" not in raw:
+                return 0, []
+    original_content = raw.decode("utf-8")
+
+    try:
+        tree = ast.parse(original_content, filename=str(file_path))
+    except SyntaxError as exc:
+        return 0, [f"  {file_path.name}: skipped, could not parse ({exc.msg})"]
+
+    calls = find_print_calls(tree)
+    if not calls:
+        return 0, []
+
+    lines = original_content.splitlines(keepends=True)
+    line_offsets = [0]
+    for line in lines:
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    def char_offset(lineno: int, col_offset: int) -> int:
+        # AST columns are UTF-8 byte offsets
+        return line_offsets[lineno - 1] + len(lines[lineno - 1].encode("utf-8")[:col_offset].decode("utf-8"))
 
-    content = original_content
     changes = []
 
-    # Find all print statements
-    print_pattern = re.compile(r'print\((.*?)\)(?:\s*#.*)?$', re.MULTILINE)
-    matches = list(print_pattern.finditer(content))
+    # Replace print names (in reverse order to maintain positions)
+    content = original_content
+    for call in sorted(calls, key=lambda node: (node.lineno, node.col_offset), reverse=True):
+        call_start = char_offset(call.lineno, call.col_offset)
+        call_end = char_offset(call.end_lineno, call.end_col_offset)
+        surrounding = original_content[max(0, call_start - 200):call_end + 200]
+        print_content = ast.get_source_segment(original_content, call.args[0])
+        log_level = determine_log_level(print_content, surrounding)
 
-    if not matches:
-        return 0, []
+        name_end = char_offset(call.func.end_lineno, call.func.end_col_offset)
+        content = content[:call_start] + f"logger.{log_level}" + content[name_end:]
+        changes.append(f"  {file_path.name}:{call.lineno} - Replaced: {original_content[call_start:call_end][:50]}")
 
     # Add logger import if needed
-    if not has_logger_import(content):
+    if not has_logger_import(original_content):
         content = add_logger_import(content, file_path.stem)
         changes.append(f"Added logger import to {file_path.name}")
 
-    # Replace print statements (in reverse order to maintain positions)
-    for match in reversed(matches):
-        # Get surrounding code for context
-        start = max(0, match.start() - 200)
-        end = min(len(content), match.end() + 200)
-        surrounding = content[start:end]
-
-        # Convert print to logger
-        old_text = match.group(0)
-        new_text = convert_print_to_logger(match, surrounding)
-
-        content = content[:match.start()] + new_text + content[match.end():]
-        changes.append(f"  {file_path.name}:{match.start()} - Replaced: {old_text[:50]}")
-
     # Only write if changes were made
     if content != original_content:
-        with open(file_path, "w", encoding="utf-8") as f:
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
             f.write(content)
 
-    return len(matches), changes
+    return len(calls), changes
 
 
 def main():
@@ -189,7 +224,7 @@ def main():
 
     # Find all Python files in prowzi
     python_files = list(PROWZI_ROOT.rglob("*.py"))
-    python_files = [f for f in python_files if "__pycache__" not in str(f)]
+    python_files = sorted(f for f in python_files if "__pycache__" not in str(f))
 
     print(f"Found {len(python_files)} Python files to process")
     print()
@@ -197,8 +232,11 @@ def main():
     total_replacements = 0
     all_changes = []
 
-    for file_path in sorted(python_files):
-        count, changes = process_file(file_path)
+    # Files are independent, so they are processed in parallel; map keeps results in file order
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, python_files, chunksize=16))
+
+    for file_path, (count, changes) in zip(python_files, results):
         if count > 0:
             total_replacements += count
             print(f"✅ {file_path.relative_to(PROWZI_ROOT)}: {count} print statements replaced")